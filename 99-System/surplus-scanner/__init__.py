@@ -2,7 +2,7 @@
 from .surplus_scraper import scrape_surplus_items, SurplusScraper, CATEGORIES
 from .ebay_researcher import research as ebay_research, research_batch as ebay_research_batch
 from .roi_calculator import calculate as roi_calculate, get_recommendation_summary
-from .surplus_scanner import run_scan, generate_report, save_report
+from .surplus_scanner import run_scan, generate_report, iter_report, save_report
 
 __all__ = [
     # Scraper
@@ -18,5 +18,6 @@ __all__ = [
     # Main Scanner
     'run_scan',
     'generate_report',
+    'iter_report',
     'save_report',
 ]
@@ -15,43 +15,238 @@ Usage:
     python surplus_scanner.py --test    # Test run without saving
 """
 
+import re
 import sys
 import os
+import time
+import shelve
+import asyncio
 import argparse
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: NumPy argsorts report rows by ROI
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Add current directory to path for local imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from surplus_scraper import scrape_surplus_items, CATEGORIES
 from ebay_researcher import research as research_ebay
-from roi_calculator import calculate as calculate_roi
+from roi_calculator import calculate_batch as calculate_roi_batch
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Vault configuration
 VAULT_PATH = Path.home() / "albatross-vault" / "04-Patterns" / "Surplus-Leads"
+REPORT_WRITE_BUFFER = 64 * 1024
 
 # Telegram configuration (from environment)
 TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 TELEGRAM_CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID')
 TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+TELEGRAM_MAX_CHARS = 4000    # Telegram rejects messages over 4096 characters
+TELEGRAM_MAX_RETRIES = 3     # Retries per message on HTTP 429 (rate limited)
+
+# Connection pooling for the shared HTTP session
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 50
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Build the pooled, keep-alive session shared by the scraper, eBay research
+    and Telegram alerts. Idempotent requests retry on transient errors.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_HTTP = _create_http_session()
+
+# Maximum eBay lookups in flight at once (ebay_researcher still spaces request starts)
+RESEARCH_CONCURRENCY = 10
+
+# eBay results are reused across scans for a day (relisted lots repeat titles)
+EBAY_CACHE_PATH = VAULT_PATH / ".ebay-cache"
+EBAY_CACHE_TTL = 24 * 60 * 60  # seconds
+EBAY_MEMO_SIZE = 4096
+
+_NON_WORD_RE = re.compile(r'\W+')
+_ebay_cache_lock = threading.Lock()  # shelve is not safe for concurrent access
+
+# In-process results by normalized title; only successful lookups are kept
+_ebay_memo: dict[str, dict] = {}
+_ebay_memo_lock = threading.Lock()
+
+
+def _normalize_title(title: str) -> str:
+    """Cache key for a title: lowercase, punctuation stripped, whitespace collapsed."""
+    return _NON_WORD_RE.sub(' ', title.lower()).strip()
+
+
+def _cache_get(key: str) -> Optional[dict]:
+    """Return an unexpired eBay result from the on-disk cache, if any."""
+    if not EBAY_CACHE_PATH.parent.exists():
+        return None
+    try:
+        with _ebay_cache_lock, shelve.open(str(EBAY_CACHE_PATH)) as cache:
+            entry = cache.get(key)
+    except Exception as e:
+        logger.warning(f"eBay cache read failed: {e}")
+        return None
+    if entry is None:
+        return None
+    stored_at, ebay_data = entry
+    if time.time() - stored_at > EBAY_CACHE_TTL:
+        return None
+    return ebay_data
+
+
+def _cache_put(key: str, ebay_data: dict) -> None:
+    """Store an eBay result in the on-disk cache."""
+    try:
+        EBAY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with _ebay_cache_lock, shelve.open(str(EBAY_CACHE_PATH)) as cache:
+            cache[key] = (time.time(), ebay_data)
+    except Exception as e:
+        logger.warning(f"eBay cache write failed: {e}")
+
+
+def _research_normalized(key: str, title: str) -> Optional[dict]:
+    """
+    Research a title cached under its normalized key, checking the in-process
+    memo and then the disk cache before eBay. eBay is searched with the
+    original title so model numbers like "HP-4050" keep their punctuation.
+    """
+    with _ebay_memo_lock:
+        ebay_data = _ebay_memo.get(key)
+    if ebay_data is not None:
+        return ebay_data
+
+    ebay_data = _cache_get(key)
+    if ebay_data is not None:
+        logger.info(f"eBay cache hit: {key}")
+    else:
+        ebay_data = research_ebay(title, _HTTP)
+        # Misses aren't memoized or persisted: None also covers network failures
+        if ebay_data is None:
+            return None
+        _cache_put(key, ebay_data)
+
+    with _ebay_memo_lock:
+        if len(_ebay_memo) >= EBAY_MEMO_SIZE:
+            _ebay_memo.pop(next(iter(_ebay_memo)))  # drop the oldest entry
+        _ebay_memo[key] = ebay_data
+    return ebay_data
+
+
+def research_cached(title: str) -> Optional[dict]:
+    """
+    Research eBay sold prices for a title, reusing earlier results.
+
+    Titles differing only in case, punctuation or spacing share one lookup,
+    memoized in-process and persisted to disk for EBAY_CACHE_TTL seconds.
+    Callers get their own copy so cached results are never mutated.
+    """
+    ebay_data = _research_normalized(_normalize_title(title), title)
+    return dict(ebay_data) if ebay_data is not None else None
+
+
+async def _research_all(items: list[dict]) -> list[Optional[dict]]:
+    """Research eBay prices for all items concurrently, preserving item order."""
+    semaphore = asyncio.Semaphore(RESEARCH_CONCURRENCY)
+    total = len(items)
+
+    async def _research_one(index: int, item: dict) -> Optional[dict]:
+        async with semaphore:
+            logger.info(f"Processing item {index}/{total}: {item['title'][:40]}...")
+            return await asyncio.to_thread(research_cached, item['title'])
+
+    return await asyncio.gather(
+        *(_research_one(i, item) for i, item in enumerate(items, 1))
+    )
+
+
+def _paginate(lines: list[str], limit: int = TELEGRAM_MAX_CHARS) -> list[str]:
+    """Join lines into as few messages as possible, each at most limit chars."""
+    pages = []
+    current = []
+    size = 0
+    for line in lines:
+        line = line[:limit]
+        added = len(line) + (1 if current else 0)
+        if current and size + added > limit:
+            pages.append("\n".join(current))
+            current, size, added = [], 0, len(line)
+        current.append(line)
+        size += added
+    if current:
+        pages.append("\n".join(current))
+    return pages
+
+
+def _retry_after(response: requests.Response) -> float:
+    """Seconds Telegram asked us to wait after a 429 response."""
+    header = response.headers.get('Retry-After')
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        return float(response.json().get('parameters', {}).get('retry_after', 1))
+    except (ValueError, TypeError, AttributeError):
+        return 1.0
+
+
+def _post_telegram_message(url: str, text: str) -> None:
+    """Post one message, backing off as instructed on HTTP 429."""
+    for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+        response = _HTTP.post(
+            url,
+            json={'chat_id': TELEGRAM_CHAT_ID, 'text': text},
+            timeout=10
+        )
+        if response.status_code == 429 and attempt < TELEGRAM_MAX_RETRIES:
+            delay = _retry_after(response)
+            logger.warning(f"Telegram rate limited - retrying in {delay:.0f}s")
+            time.sleep(delay)
+            continue
+        response.raise_for_status()
+        return
 
 
 def send_telegram_alert(strong_bids: list[dict]) -> bool:
     """
     Send Telegram alert for STRONG BID items.
 
+    Every item is listed; the alert is split into as few messages as
+    fit Telegram's size limit. Sent as plain text so titles containing
+    '<' or '&' can't break server-side parsing.
+
     Args:
         strong_bids: List of items with STRONG BID recommendation
 
@@ -73,82 +268,103 @@ def send_telegram_alert(strong_bids: list[dict]) -> bool:
         f"🎯 STRONG BIDS: {len(strong_bids)}",
     ]
 
-    for item in strong_bids[:10]:  # Limit to 10 items in alert
+    for item in strong_bids:
         roi = item.get('roi', {}).get('roi_percent', 0)
         title = item.get('title', 'Unknown')[:40]
         lines.append(f"• {title} - ROI: {roi:.0f}%")
 
-    if len(strong_bids) > 10:
-        lines.append(f"• ... and {len(strong_bids) - 10} more")
-
     lines.append("")
     lines.append("Check vault for full report.")
 
-    message = "\n".join(lines)
+    pages = _paginate(lines)
 
     try:
         url = TELEGRAM_API_URL.format(token=TELEGRAM_BOT_TOKEN)
-        response = requests.post(
-            url,
-            json={
-                'chat_id': TELEGRAM_CHAT_ID,
-                'text': message,
-                'parse_mode': 'HTML'
-            },
-            timeout=10
-        )
-        response.raise_for_status()
-        logger.info("Telegram alert sent successfully")
+        for page in pages:
+            _post_telegram_message(url, page)
+        logger.info(f"Telegram alert sent successfully ({len(pages)} message(s))")
         return True
     except requests.RequestException as e:
         logger.error(f"Failed to send Telegram alert: {e}")
         return False
 
 
-def generate_report(items: list[dict], scan_time: datetime) -> str:
+def classify_items(items: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
     """
-    Generate markdown report for vault.
+    Split items by ROI recommendation in a single pass.
+
+    Returns:
+        (strong_bids, watch_items, no_data_items)
+    """
+    strong_bids, watch_items, no_data_items = [], [], []
+    for item in items:
+        roi = item.get('roi')
+        recommendation = roi.get('recommendation') if roi else None
+        if recommendation == 'STRONG BID':
+            strong_bids.append(item)
+        elif recommendation == 'WATCH':
+            watch_items.append(item)
+        else:
+            no_data_items.append(item)
+    return strong_bids, watch_items, no_data_items
+
+
+def _by_roi_desc(items: list[dict]) -> list[dict]:
+    """Items ordered by ROI percent, highest first (ties keep scan order)."""
+    if np is None or len(items) < 2:
+        return sorted(items, key=lambda x: x.get('roi', {}).get('roi_percent', 0), reverse=True)
+    rois = np.fromiter(
+        (item.get('roi', {}).get('roi_percent', 0) for item in items),
+        dtype=np.float64,
+        count=len(items),
+    )
+    return [items[i] for i in np.argsort(-rois, kind='stable')]
+
+
+def iter_report(
+    items: list[dict],
+    scan_time: datetime,
+    buckets: Optional[tuple[list[dict], list[dict], list[dict]]] = None
+) -> Iterator[str]:
+    """
+    Generate markdown report for vault as a stream of text chunks.
 
     Args:
         items: List of processed items with eBay data and ROI
         scan_time: Timestamp of scan
+        buckets: Optional result of classify_items(items), to skip re-classifying
 
-    Returns:
-        Markdown formatted report string
+    Yields:
+        Consecutive pieces of the markdown report
     """
     date_str = scan_time.strftime('%Y-%m-%d')
     time_str = scan_time.strftime('%H:%M')
 
     # Separate items by recommendation
-    strong_bids = [i for i in items if i.get('roi', {}).get('recommendation') == 'STRONG BID']
-    watch_items = [i for i in items if i.get('roi', {}).get('recommendation') == 'WATCH']
-    no_data_items = [i for i in items if i.get('roi') is None]
+    strong_bids, watch_items, no_data_items = buckets or classify_items(items)
 
-    # Build report
-    lines = [
-        f"# Surplus Scan Report - {date_str}",
-        "",
-        "## Summary",
-        "",
-        f"- **Scan Time:** {time_str}",
-        f"- **Categories Monitored:** {', '.join(CATEGORIES.values())}",
-        f"- **Total Items Found:** {len(items)}",
-        f"- **STRONG BID Items:** {len(strong_bids)}",
-        f"- **WATCH Items:** {len(watch_items)}",
-        f"- **No eBay Data:** {len(no_data_items)}",
-        "",
-    ]
+    yield f"""# Surplus Scan Report - {date_str}
+
+## Summary
+
+- **Scan Time:** {time_str}
+- **Categories Monitored:** {', '.join(CATEGORIES.values())}
+- **Total Items Found:** {len(items)}
+- **STRONG BID Items:** {len(strong_bids)}
+- **WATCH Items:** {len(watch_items)}
+- **No eBay Data:** {len(no_data_items)}
+
+"""
 
     # STRONG BID section
     if strong_bids:
-        lines.extend([
-            "## 🎯 STRONG BID Items",
-            "",
-            "| Item | Current Bid | eBay Avg | ROI | Max Bid |",
-            "|------|-------------|----------|-----|---------|",
-        ])
-
-        for item in sorted(strong_bids, key=lambda x: x.get('roi', {}).get('roi_percent', 0), reverse=True):
+        yield """## 🎯 STRONG BID Items
+
+| Item | Current Bid | eBay Avg | ROI | Max Bid |
+|------|-------------|----------|-----|---------|
+"""
+
+        for item in _by_roi_desc(strong_bids):
             title = item.get('title', 'Unknown')[:35]
             current = item.get('current_bid', 0)
             ebay_avg = item.get('ebay', {}).get('average_price', 0)
@@ -156,22 +372,19 @@ def generate_report(items: list[dict], scan_time: datetime) -> str:
             max_bid = item.get('roi', {}).get('max_bid_100_roi', 0)
             url = item.get('url', '')
 
-            lines.append(
-                f"| [{title}]({url}) | ${current:.2f} | ${ebay_avg:.2f} | {roi:.0f}% | ${max_bid:.2f} |"
-            )
+            yield f"| [{title}]({url}) | ${current:.2f} | ${ebay_avg:.2f} | {roi:.0f}% | ${max_bid:.2f} |\n"
 
-        lines.append("")
+        yield "\n"
 
     # WATCH section
     if watch_items:
-        lines.extend([
-            "## 👀 WATCH Items",
-            "",
-            "| Item | Current Bid | eBay Avg | ROI | Notes |",
-            "|------|-------------|----------|-----|-------|",
-        ])
-
-        for item in sorted(watch_items, key=lambda x: x.get('roi', {}).get('roi_percent', 0), reverse=True):
+        yield """## 👀 WATCH Items
+
+| Item | Current Bid | eBay Avg | ROI | Notes |
+|------|-------------|----------|-----|-------|
+"""
+
+        for item in _by_roi_desc(watch_items):
             title = item.get('title', 'Unknown')[:35]
             current = item.get('current_bid', 0)
             ebay_avg = item.get('ebay', {}).get('average_price', 0)
@@ -185,36 +398,32 @@ def generate_report(items: list[dict], scan_time: datetime) -> str:
             else:
                 note = "Monitor price"
 
-            lines.append(
-                f"| [{title}]({url}) | ${current:.2f} | ${ebay_avg:.2f} | {roi:.0f}% | {note} |"
-            )
+            yield f"| [{title}]({url}) | ${current:.2f} | ${ebay_avg:.2f} | {roi:.0f}% | {note} |\n"
 
-        lines.append("")
+        yield "\n"
 
     # No data section
     if no_data_items:
-        lines.extend([
-            "## ❓ No eBay Data",
-            "",
-            "These items had no matching eBay sold listings:",
-            "",
-        ])
+        yield """## ❓ No eBay Data
+
+These items had no matching eBay sold listings:
+
+"""
 
         for item in no_data_items:
             title = item.get('title', 'Unknown')
             url = item.get('url', '')
-            lines.append(f"- [{title}]({url})")
+            yield f"- [{title}]({url})\n"
 
-        lines.append("")
+        yield "\n"
 
     # Detailed breakdowns for STRONG BIDs
     if strong_bids:
-        lines.extend([
-            "---",
-            "",
-            "## Detailed Analysis - STRONG BID Items",
-            "",
-        ])
+        yield """---
+
+## Detailed Analysis - STRONG BID Items
+
+"""
 
         for item in strong_bids:
             title = item.get('title', 'Unknown')
@@ -225,59 +434,78 @@ def generate_report(items: list[dict], scan_time: datetime) -> str:
             ebay = item.get('ebay', {})
             roi = item.get('roi', {})
 
-            lines.extend([
-                f"### {title}",
-                "",
-                f"- **Item ID:** {item_id}",
-                f"- **Category:** {category}",
-                f"- **Location:** {item.get('location', 'N/A')}",
-                f"- **Current Bid:** ${current:.2f}",
-                f"- **Auction Ends:** {item.get('end_date', 'N/A')}",
-                f"- **URL:** {url}",
-                "",
-                "**eBay Research:**",
-                f"- Average Sold: ${ebay.get('average_price', 0):.2f}",
-                f"- Price Range: {ebay.get('price_range', 'N/A')}",
-                f"- Sold Count: {ebay.get('sold_count', 0)}",
-                f"- Confidence: {ebay.get('confidence', 'N/A')}",
-                f"- [View eBay Search]({ebay.get('search_url', '')})",
-                "",
-                "**ROI Analysis:**",
-                f"- Expected Sale (after 25% discount): ${roi.get('expected_sale', 0):.2f}",
-                f"- eBay Fees (13%): ${roi.get('ebay_fees', 0):.2f}",
-                f"- Shipping: ${roi.get('shipping', 0):.2f}",
-                f"- Net Proceeds: ${roi.get('net_proceeds', 0):.2f}",
-                f"- **Profit: ${roi.get('profit', 0):.2f}**",
-                f"- **ROI: {roi.get('roi_percent', 0):.0f}%**",
-                f"- Max Bid for 100% ROI: ${roi.get('max_bid_100_roi', 0):.2f}",
-                "",
-            ])
+            yield f"""### {title}
+
+- **Item ID:** {item_id}
+- **Category:** {category}
+- **Location:** {item.get('location', 'N/A')}
+- **Current Bid:** ${current:.2f}
+- **Auction Ends:** {item.get('end_date', 'N/A')}
+- **URL:** {url}
+
+**eBay Research:**
+- Average Sold: ${ebay.get('average_price', 0):.2f}
+- Price Range: {ebay.get('price_range', 'N/A')}
+- Sold Count: {ebay.get('sold_count', 0)}
+- Confidence: {ebay.get('confidence', 'N/A')}
+- [View eBay Search]({ebay.get('search_url', '')})
+
+**ROI Analysis:**
+- Expected Sale (after 25% discount): ${roi.get('expected_sale', 0):.2f}
+- eBay Fees (13%): ${roi.get('ebay_fees', 0):.2f}
+- Shipping: ${roi.get('shipping', 0):.2f}
+- Net Proceeds: ${roi.get('net_proceeds', 0):.2f}
+- **Profit: ${roi.get('profit', 0):.2f}**
+- **ROI: {roi.get('roi_percent', 0):.0f}%**
+- Max Bid for 100% ROI: ${roi.get('max_bid_100_roi', 0):.2f}
+
+"""
 
     # Action items
-    lines.extend([
-        "---",
-        "",
-        "## Action Items",
-        "",
-        "- [ ] Review STRONG BID items",
-        "- [ ] Place bids on priority items",
-        "- [ ] Set calendar reminders for auction end times",
-        "- [ ] Research any items without eBay data manually",
-        "",
-        "---",
-        "",
-        f"*Generated by Albatross Surplus Scanner at {scan_time.strftime('%Y-%m-%d %H:%M:%S')}*",
-    ])
+    yield f"""---
+
+## Action Items
 
-    return "\n".join(lines)
+- [ ] Review STRONG BID items
+- [ ] Place bids on priority items
+- [ ] Set calendar reminders for auction end times
+- [ ] Research any items without eBay data manually
 
+---
 
-def save_report(report: str, scan_time: datetime) -> Path:
+*Generated by Albatross Surplus Scanner at {scan_time.strftime('%Y-%m-%d %H:%M:%S')}*"""
+
+
+def generate_report(
+    items: list[dict],
+    scan_time: datetime,
+    buckets: Optional[tuple[list[dict], list[dict], list[dict]]] = None
+) -> str:
+    """
+    Generate markdown report for vault.
+
+    Args:
+        items: List of processed items with eBay data and ROI
+        scan_time: Timestamp of scan
+        buckets: Optional result of classify_items(items), to skip re-classifying
+
+    Returns:
+        Markdown formatted report string
+    """
+    return "".join(iter_report(items, scan_time, buckets))
+
+
+def save_report(report: Union[str, Iterable[str]], scan_time: datetime) -> Path:
     """
     Save report to vault.
 
+    Chunks are written to a temporary file that replaces the report only
+    once every chunk is written, so a failure partway never leaves a
+    truncated report behind.
+
     Args:
-        report: Markdown report content
+        report: Markdown report content, or chunks of it (e.g. from iter_report)
+            which are written as they are produced
         scan_time: Timestamp for filename
 
     Returns:
@@ -290,8 +518,17 @@ def save_report(report: str, scan_time: datetime) -> Path:
     filename = f"surplus-scan-{scan_time.strftime('%Y-%m-%d')}.md"
     filepath = VAULT_PATH / filename
 
-    # Write report
-    filepath.write_text(report, encoding='utf-8')
+    # Write report, streaming chunks through a buffered temp file
+    if isinstance(report, str):
+        report = (report,)
+    temp_path = filepath.with_name(filepath.name + '.tmp')
+    try:
+        with temp_path.open('w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+            f.writelines(report)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
     logger.info(f"Report saved to: {filepath}")
 
     return filepath
@@ -314,7 +551,7 @@ def run_scan(test_mode: bool = False) -> dict:
 
     # Step 1: Scrape surplus items
     logger.info("Step 1: Scraping Alberta Surplus Sales...")
-    items = scrape_surplus_items()
+    items = scrape_surplus_items(_HTTP)
 
     if not items:
         logger.warning("No items found from surplus scraper")
@@ -330,38 +567,38 @@ def run_scan(test_mode: bool = False) -> dict:
     # Step 2 & 3: Research eBay and calculate ROI for each item
     logger.info("Step 2-3: Researching eBay prices and calculating ROI...")
 
-    processed_items = []
-    for i, item in enumerate(items, 1):
-        logger.info(f"Processing item {i}/{len(items)}: {item['title'][:40]}...")
+    # eBay lookups are network-bound, so run them concurrently
+    ebay_results = asyncio.run(_research_all(items))
 
-        # Research eBay
-        ebay_data = research_ebay(item['title'])
+    # Every item is kept and enriched in place, so no second list is built
+    processed_items = items
+    priced = []  # (item, current_bid) for items with eBay data
+    for item, ebay_data in zip(items, ebay_results):
         item['ebay'] = ebay_data
-
-        # Calculate ROI
-        current_bid = item.get('current_bid', 0)
-        if current_bid == 0:
-            current_bid = 1.0  # Assume $1 starting bid if 0
+        item['roi'] = None
 
         if ebay_data:
-            roi_data = calculate_roi(current_bid, ebay_data)
-            item['roi'] = roi_data
-        else:
-            item['roi'] = None
+            current_bid = item.get('current_bid', 0)
+            if current_bid == 0:
+                current_bid = 1.0  # Assume $1 starting bid if 0
+            priced.append((item, current_bid))
 
-        processed_items.append(item)
+    # Calculate ROI for all priced items in one (vectorized) batch
+    roi_results = calculate_roi_batch([(bid, item['ebay']) for item, bid in priced])
+    for (item, _), roi_data in zip(priced, roi_results):
+        item['roi'] = roi_data
 
     # Separate by recommendation (handle None roi safely)
-    strong_bids = [i for i in processed_items if (i.get('roi') or {}).get('recommendation') == 'STRONG BID']
-    watch_items = [i for i in processed_items if (i.get('roi') or {}).get('recommendation') == 'WATCH']
+    buckets = classify_items(processed_items)
+    strong_bids, watch_items, _ = buckets
 
     logger.info(f"Results: {len(strong_bids)} STRONG BID, {len(watch_items)} WATCH")
 
     # Step 4: Generate report
     logger.info("Step 4: Generating report...")
-    report = generate_report(processed_items, scan_time)
 
     if test_mode:
+        report = generate_report(processed_items, scan_time, buckets)
         logger.info("TEST MODE - Report preview:")
         print("\n" + "=" * 60)
         # Handle potential Unicode issues on Windows console
@@ -373,9 +610,9 @@ def run_scan(test_mode: bool = False) -> dict:
             print(f"\n... [{len(report) - 2000} more characters]")
         print("=" * 60)
     else:
-        # Step 5: Save to vault
+        # Step 5: Save to vault (report is streamed to disk as it's generated)
         logger.info("Step 5: Saving to vault...")
-        filepath = save_report(report, scan_time)
+        filepath = save_report(iter_report(processed_items, scan_time, buckets), scan_time)
 
         # Step 6: Send Telegram alert
         if strong_bids:
@@ -440,4 +677,10 @@ def main():
 
 
 if __name__ == '__main__':
+    # Configure logging only when run as a script, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
     main()
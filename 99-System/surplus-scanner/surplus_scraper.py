@@ -10,19 +10,35 @@ Site uses ASP.NET with server-rendered HTML. No JavaScript/Selenium needed.
 """
 
 import re
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Optional: aiohttp fetches all category pages concurrently
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Prefer the C-based lxml parser when installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional: selectolax (lexbor, C) parses category pages much faster than bs4
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Base URLs
@@ -43,6 +59,52 @@ CATEGORIES = {
 # Required location filter
 TARGET_LOCATION = "Surplus Sales Calgary"
 
+# Only the item GridView is materialized when parsing a category page
+GRIDVIEW_ID_RE = re.compile(r'GridView1', re.I)
+GRIDVIEW_STRAINER = SoupStrainer('table', id=GRIDVIEW_ID_RE)
+GRID_CLASS_RE = re.compile(r'grid|list', re.I)  # fallback table lookup
+
+# Row parsing: elements of interest, and which field an element id maps to
+FIELD_TAGS = ('a', 'span', 'div')
+ITEM_DETAIL_RE = re.compile(r'ItemDetail\.aspx', re.I)
+AUCTION_ID_RE = re.compile(r'AuctionID=(\d+)', re.I)
+DIGITS_RE = re.compile(r'(\d+)')
+FIELD_ID_RE = re.compile(
+    r'(?P<title>hlTitle)'
+    r'|(?P<high_bid>lblHighBidAmt|HighBid)'
+    r'|(?P<start_bid>lblStartBid|StartingBid)'
+    r'|(?P<bid_count>lblBidCount|NumBids)'
+    r'|(?P<countdown>pnlCountdown)'
+    r'|(?P<close>lblClose|ClosingDate)'
+    r'|(?P<location>lblLocation|Location)'
+    r'|(?P<condition>lblCondition|Condition)',
+    re.I
+)
+FIELD_ID_TAGS = {
+    'title': 'a',
+    'high_bid': 'span',
+    'start_bid': 'span',
+    'bid_count': 'span',
+    'countdown': 'div',
+    'close': 'span',
+    'location': 'span',
+    'condition': 'span',
+}
+
+# Price cleaning: drop every ASCII char except digits and '.'
+PRICE_DELETE_TABLE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if chr(c) not in '0123456789.')
+)
+NON_PRICE_RE = re.compile(r'[^\d.]')
+
+# Non-ISO end date formats, e.g. "MM/DD/YYYY HH:MM:SS AM/PM"
+# (ISO dates are handled by datetime.fromisoformat first)
+END_DATE_FORMATS = (
+    '%m/%d/%Y %I:%M:%S %p',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y',
+)
+
 # Request configuration
 REQUEST_TIMEOUT = 15
 REQUEST_HEADERS = {
@@ -53,20 +115,74 @@ REQUEST_HEADERS = {
 }
 
 
+class _SelectolaxTag:
+    """
+    The small part of the BeautifulSoup Tag API that row parsing uses,
+    backed by a selectolax node.
+    """
+
+    __slots__ = ('_node', 'name')
+
+    def __init__(self, node):
+        self._node = node
+        self.name = node.tag
+
+    def get(self, key: str, default=None):
+        value = self._node.attributes.get(key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> str:
+        return self._node.attributes[key] or ''
+
+    def get_text(self, strip: bool = False) -> str:
+        return self._node.text(strip=strip)
+
+    def find_all(self, names) -> list['_SelectolaxTag']:
+        """Descendant elements with the given tag name(s), in document order."""
+        if isinstance(names, str):
+            names = (names,)
+        # traverse() yields this node first, then its subtree
+        return [
+            _SelectolaxTag(node) for node in self._node.traverse()
+            if node.tag in names and node is not self._node
+        ]
+
+
+def _find_gridview_selectolax(html: bytes) -> Optional[_SelectolaxTag]:
+    """selectolax counterpart of SurplusScraper._find_gridview."""
+    tree = LexborHTMLParser(html)
+    tables = tree.css('table')
+    for table in tables:
+        if GRIDVIEW_ID_RE.search(table.attributes.get('id') or ''):
+            return _SelectolaxTag(table)
+    # Alternate table patterns
+    for table in tables:
+        if GRID_CLASS_RE.search(table.attributes.get('class') or ''):
+            return _SelectolaxTag(table)
+    return None
+
+
 class SurplusScraper:
     """Scraper for Alberta Government Surplus Sales website."""
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(REQUEST_HEADERS)
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Args:
+            session: Optional shared requests.Session (connection pool) to
+                fetch pages with; a private one is created if omitted. An
+                injected session is always used, so its pool and retry
+                policy apply to every page.
+        """
+        self._session_injected = session is not None
+        self.session = session or requests.Session()
 
-    def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch a page and return BeautifulSoup object."""
+    def _fetch_page(self, url: str) -> Optional[bytes]:
+        """Fetch a page and return its raw HTML bytes."""
         try:
             logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            response = self.session.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            return response.content
         except requests.Timeout:
             logger.error(f"Timeout fetching {url}")
             return None
@@ -74,47 +190,70 @@ class SurplusScraper:
             logger.error(f"Request failed for {url}: {e}")
             return None
 
+    async def _fetch_page_async(self, session, url: str) -> Optional[bytes]:
+        """Fetch a page with a shared aiohttp session and return its raw HTML bytes."""
+        try:
+            logger.info(f"Fetching: {url}")
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.read()
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout fetching {url}")
+            return None
+        except aiohttp.ClientError as e:
+            logger.error(f"Request failed for {url}: {e}")
+            return None
+
     def _parse_price(self, price_text: str) -> float:
         """Extract numeric price from text like '$125.00' or 'CAD 125.00'."""
         if not price_text:
             return 0.0
-        cleaned = re.sub(r'[^\d.]', '', price_text)
+        cleaned = price_text.translate(PRICE_DELETE_TABLE)
+        if not cleaned.isascii():
+            # Rare: non-ASCII symbols/digits left over, use the full regex
+            cleaned = NON_PRICE_RE.sub('', cleaned)
         try:
             return float(cleaned) if cleaned else 0.0
         except ValueError:
             return 0.0
 
-    def _parse_end_date(self, date_str: str) -> tuple[str, bool]:
+    def _parse_end_date(self, date_str: str, now: Optional[datetime] = None) -> tuple[str, bool]:
         """
         Parse end date and determine if auction is active.
         Returns (formatted_date_str, is_active).
+
+        Pass now when parsing many rows to avoid a clock read per row.
         """
         if not date_str:
             return '', True
 
         date_str = date_str.strip()
+        end_date = None
 
-        # Site uses ISO-like format: "YYYY-MM-DDTHH:MM:SS" or "MM/DD/YYYY HH:MM:SS AM/PM"
-        formats = [
-            '%Y-%m-%dT%H:%M:%S',  # ISO format from closingdate attribute
-            '%Y-%m-%d %H:%M:%S',
-            '%m/%d/%Y %I:%M:%S %p',
-            '%m/%d/%Y %H:%M:%S',
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-        ]
+        # Site mostly uses ISO "YYYY-MM-DDTHH:MM:SS" (countdown closingdate);
+        # fromisoformat is C-implemented and much faster than strptime
+        try:
+            end_date = datetime.fromisoformat(date_str)
+            if end_date.tzinfo is not None:
+                end_date = None  # Can't compare with naive local time
+        except ValueError:
+            pass
 
-        for fmt in formats:
-            try:
-                end_date = datetime.strptime(date_str, fmt)
-                is_active = end_date > datetime.now()
-                # Return ISO format for consistency
-                return end_date.strftime('%Y-%m-%d %H:%M:%S'), is_active
-            except ValueError:
-                continue
+        if end_date is None:
+            for fmt in END_DATE_FORMATS:
+                try:
+                    end_date = datetime.strptime(date_str, fmt)
+                    break
+                except ValueError:
+                    continue
 
-        # If parsing fails, return original and assume active
-        return date_str, True
+        if end_date is None:
+            # If parsing fails, return original and assume active
+            return date_str, True
+
+        is_active = end_date > (now or datetime.now())
+        # Return ISO format for consistency
+        return end_date.strftime('%Y-%m-%d %H:%M:%S'), is_active
 
     def _get_category_url(self, category_id: str) -> str:
         """Build URL for a specific category listing."""
@@ -122,19 +261,37 @@ class SurplusScraper:
 
     def _scrape_category(self, category_id: str) -> list[dict]:
         """Scrape all items from a single category."""
-        items = []
-        category_name = CATEGORIES.get(category_id, 'Unknown')
+        html = self._fetch_page(self._get_category_url(category_id))
+        return self._parse_category(html, category_id)
+
+    async def _scrape_category_async(self, session, category_id: str) -> list[dict]:
+        """Scrape all items from a single category over a shared aiohttp session."""
         url = self._get_category_url(category_id)
+        html = await self._fetch_page_async(session, url)
+        return self._parse_category(html, category_id)
 
-        soup = self._fetch_page(url)
-        if not soup:
-            return items
+    def _find_gridview(self, html: bytes):
+        """Locate the auction item table, parsing only that subtree when possible."""
+        if LexborHTMLParser is not None:
+            return _find_gridview_selectolax(html)
 
         # Find the GridView table containing auction items
-        gridview = soup.find('table', id=re.compile(r'GridView1', re.I))
+        gridview = BeautifulSoup(html, HTML_PARSER, parse_only=GRIDVIEW_STRAINER).table
         if not gridview:
-            # Try alternate table patterns
-            gridview = soup.find('table', class_=re.compile(r'grid|list', re.I))
+            # Try alternate table patterns (needs a full parse)
+            soup = BeautifulSoup(html, HTML_PARSER)
+            gridview = soup.find('table', class_=GRID_CLASS_RE)
+        return gridview
+
+    def _parse_category(self, html: Optional[bytes], category_id: str) -> list[dict]:
+        """Parse the items out of a fetched category page."""
+        items = []
+        category_name = CATEGORIES.get(category_id, 'Unknown')
+
+        if not html:
+            return items
+
+        gridview = self._find_gridview(html)
 
         if not gridview:
             logger.warning(f"No item grid found for category {category_id}")
@@ -146,6 +303,9 @@ class SurplusScraper:
             logger.info(f"No items in category {category_id}")
             return items
 
+        # One clock read per page rather than per row
+        now = datetime.now()
+
         # Skip header row
         for row in rows[1:]:
             cells = row.find_all('td')
@@ -153,7 +313,7 @@ class SurplusScraper:
                 continue
 
             try:
-                item = self._parse_row(cells, category_id, category_name)
+                item = self._parse_row(cells, category_id, category_name, now)
                 if item:
                     items.append(item)
             except Exception as e:
@@ -163,113 +323,98 @@ class SurplusScraper:
         logger.info(f"Found {len(items)} Calgary items in {category_name}")
         return items
 
-    def _parse_row(self, cells: list, category_id: str, category_name: str) -> Optional[dict]:
+    def _parse_row(self, cells: list, category_id: str, category_name: str,
+                   now: Optional[datetime] = None) -> Optional[dict]:
         """Parse a table row into an item dictionary."""
 
-        # Extract item ID from the first link (cell 0 has just the ID)
-        item_id = None
-        title = 'Unknown Item'
-        item_url = AUCTION_BASE
-
-        # First, find the auction ID from any ItemDetail link
+        # Single pass over the row's elements: collect ItemDetail links and
+        # the first element of each id-identified field
+        detail_links = []
+        fields = {}
         for cell in cells:
-            link = cell.find('a', href=re.compile(r'ItemDetail\.aspx', re.I))
-            if link:
-                href = link.get('href', '')
-                item_url = urljoin(AUCTION_BASE + '/', href)
-                id_match = re.search(r'AuctionID=(\d+)', href, re.I)
-                if id_match:
-                    item_id = id_match.group(1)
-                break
-
-        if not item_id:
+            for elem in cell.find_all(FIELD_TAGS):
+                if elem.name == 'a' and ITEM_DETAIL_RE.search(elem.get('href', '')):
+                    detail_links.append(elem)
+                elem_id = elem.get('id')
+                if not elem_id:
+                    continue
+                match = FIELD_ID_RE.search(elem_id)
+                if match and elem.name == FIELD_ID_TAGS[match.lastgroup]:
+                    if match.lastgroup not in fields:
+                        fields[match.lastgroup] = elem
+
+        # Extract item ID from the first ItemDetail link
+        if not detail_links:
             return None
+        href = detail_links[0].get('href', '')
+        item_url = urljoin(AUCTION_BASE + '/', href)
+        id_match = AUCTION_ID_RE.search(href)
+        if not id_match:
+            return None
+        item_id = id_match.group(1)
 
-        # Find the title - look for link with 'hlTitle' in its ID (contains actual item name)
-        for cell in cells:
-            title_link = cell.find('a', id=re.compile(r'hlTitle', re.I))
-            if title_link:
-                title = title_link.get_text(strip=True)
-                break
-
-        # If no hlTitle found, try finding a descriptive link (not just the ID)
-        if title == 'Unknown Item':
+        # Location first: most rows are outside Calgary, so filter before
+        # extracting anything else
+        location = ''
+        if 'location' in fields:
+            location = fields['location'].get_text(strip=True)
+        else:
+            # No location span: last resort, look for the location cell's text
             for cell in cells:
-                for link in cell.find_all('a', href=re.compile(r'ItemDetail\.aspx', re.I)):
-                    link_text = link.get_text(strip=True)
-                    # Skip if text is just the auction ID
-                    if link_text and link_text != item_id and not link_text.isdigit():
-                        title = link_text
-                        break
-                if title != 'Unknown Item':
+                cell_text = cell.get_text(strip=True)
+                if 'Surplus Sales' in cell_text:
+                    location = cell_text
                     break
 
-        # Extract current bid - look for span with lblHighBidAmt in id
-        current_bid = 0.0
-        for cell in cells:
-            bid_span = cell.find('span', id=re.compile(r'lblHighBidAmt|HighBid', re.I))
-            if bid_span:
-                current_bid = self._parse_price(bid_span.get_text())
-                break
-            # Also check for starting bid if no high bid
-            start_bid = cell.find('span', id=re.compile(r'lblStartBid|StartingBid', re.I))
-            if start_bid and current_bid == 0.0:
-                current_bid = self._parse_price(start_bid.get_text())
+        # Filter by Calgary location
+        if TARGET_LOCATION.lower() not in location.lower():
+            if 'calgary' not in location.lower():
+                return None
 
-        # Extract bid count - site may not show this directly
-        bid_count = 0
-        for cell in cells:
-            bid_count_elem = cell.find('span', id=re.compile(r'lblBidCount|NumBids', re.I))
-            if bid_count_elem:
-                bid_text = bid_count_elem.get_text()
-                match = re.search(r'(\d+)', bid_text)
-                if match:
-                    bid_count = int(match.group(1))
-                break
-
-        # Extract end date from countdown div's closingdate attribute
+        # Extract end date from countdown div's closingdate attribute,
+        # else from a closing-date span
         end_date = ''
         is_active = True
-        for cell in cells:
-            countdown = cell.find('div', id=re.compile(r'pnlCountdown', re.I))
-            if countdown and countdown.get('closingdate'):
-                end_date, is_active = self._parse_end_date(countdown['closingdate'])
-                break
-            # Also try span with closing date
-            close_span = cell.find('span', id=re.compile(r'lblClose|ClosingDate', re.I))
-            if close_span:
-                end_date, is_active = self._parse_end_date(close_span.get_text())
-                break
-
-        # Skip ended auctions
+        countdown = fields.get('countdown')
+        if countdown is not None and countdown.get('closingdate'):
+            end_date, is_active = self._parse_end_date(countdown['closingdate'], now)
+        elif 'close' in fields:
+            end_date, is_active = self._parse_end_date(fields['close'].get_text(), now)
+
+        # Skip ended auctions before title and bid extraction
         if not is_active:
             return None
 
-        # Extract location
-        location = ''
-        for cell in cells:
-            cell_text = cell.get_text(strip=True)
-            if 'Surplus Sales' in cell_text:
-                location = cell_text
-                break
-            # Check for location span
-            loc_span = cell.find('span', id=re.compile(r'lblLocation|Location', re.I))
-            if loc_span:
-                location = loc_span.get_text(strip=True)
-                break
+        # Title from the 'hlTitle' link, else the first descriptive ItemDetail link
+        title = 'Unknown Item'
+        if 'title' in fields:
+            title = fields['title'].get_text(strip=True)
+        else:
+            for link in detail_links:
+                link_text = link.get_text(strip=True)
+                # Skip if text is just the auction ID
+                if link_text and link_text != item_id and not link_text.isdigit():
+                    title = link_text
+                    break
 
-        # Filter by Calgary location
-        if TARGET_LOCATION.lower() not in location.lower():
-            if 'calgary' not in location.lower():
-                return None
+        # Current bid: high bid amount, else the starting bid
+        current_bid = 0.0
+        if 'high_bid' in fields:
+            current_bid = self._parse_price(fields['high_bid'].get_text())
+        elif 'start_bid' in fields:
+            current_bid = self._parse_price(fields['start_bid'].get_text())
+
+        # Extract bid count - site may not show this directly
+        bid_count = 0
+        if 'bid_count' in fields:
+            match = DIGITS_RE.search(fields['bid_count'].get_text())
+            if match:
+                bid_count = int(match.group(1))
 
         # Extract condition (usually "As-Is" for surplus)
         condition = 'As-Is'
-        for cell in cells:
-            cond_span = cell.find('span', id=re.compile(r'lblCondition|Condition', re.I))
-            if cond_span:
-                condition = cond_span.get_text(strip=True) or 'As-Is'
-                break
+        if 'condition' in fields:
+            condition = fields['condition'].get_text(strip=True) or 'As-Is'
 
         return {
             'item_id': str(item_id),
@@ -285,15 +430,30 @@ class SurplusScraper:
         }
 
     def scrape_all_categories(self) -> list[dict]:
-        """Scrape all monitored categories and return combined results."""
+        """
+        Scrape all monitored categories and return combined results.
+
+        Category pages are fetched concurrently: on a thread pool through
+        self.session when a session was injected, else with aiohttp when
+        it is installed and no event loop is already running.
+        """
+        if not self._session_injected and aiohttp is not None and not _loop_running():
+            return asyncio.run(self.scrape_all_categories_async())
+
         all_items = []
 
         logger.info(f"Starting scrape of {len(CATEGORIES)} categories...")
 
-        for category_id in CATEGORIES:
+        with ThreadPoolExecutor(max_workers=len(CATEGORIES)) as executor:
+            futures = {
+                category_id: executor.submit(self._scrape_category, category_id)
+                for category_id in CATEGORIES
+            }
+
+        # Collect in CATEGORIES order so output matches the serial scrape
+        for category_id, future in futures.items():
             try:
-                items = self._scrape_category(category_id)
-                all_items.extend(items)
+                all_items.extend(future.result())
             except Exception as e:
                 logger.error(f"Failed to scrape category {category_id}: {e}")
                 continue
@@ -301,19 +461,57 @@ class SurplusScraper:
         logger.info(f"Scrape complete. Total Calgary items found: {len(all_items)}")
         return all_items
 
+    async def scrape_all_categories_async(self) -> list[dict]:
+        """Scrape all monitored categories concurrently (requires aiohttp)."""
+        all_items = []
 
-def scrape_surplus_items() -> list[dict]:
+        logger.info(f"Starting concurrent scrape of {len(CATEGORIES)} categories...")
+
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(headers=REQUEST_HEADERS, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._scrape_category_async(session, cid) for cid in CATEGORIES),
+                return_exceptions=True
+            )
+
+        for category_id, items in zip(CATEGORIES, results):
+            if isinstance(items, Exception):
+                logger.error(f"Failed to scrape category {category_id}: {items}")
+                continue
+            all_items.extend(items)
+
+        logger.info(f"Scrape complete. Total Calgary items found: {len(all_items)}")
+        return all_items
+
+
+def _loop_running() -> bool:
+    """True if called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def scrape_surplus_items(session: Optional[requests.Session] = None) -> list[dict]:
     """
     Main entry point for scraping surplus items.
     Returns list of item dictionaries filtered for Calgary location.
 
-    This function is intended to be imported by surplus_scanner.py
+    This function is intended to be imported by surplus_scanner.py,
+    which passes in its shared HTTP session.
     """
-    scraper = SurplusScraper()
+    scraper = SurplusScraper(session)
     return scraper.scrape_all_categories()
 
 
 if __name__ == '__main__':
+    # Configure logging only when run as a script, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
     # Test run
     print("=" * 60)
     print("Alberta Surplus Sales Scraper - Test Run")
@@ -8,10 +8,11 @@ try:
 except ImportError:
     AlbatrossBot = None
 
-from .telegram_alerts import TelegramAlerts, OpportunityData
+from .telegram_alerts import AlertFormatter, TelegramAlerts, OpportunityData
 
 __all__ = [
     'AlbatrossBot',
+    'AlertFormatter',
     'TelegramAlerts',
     'OpportunityData',
 ]
@@ -2,31 +2,223 @@
 """
 Telegram Alert Formatter
 Formats and sends Telegram alerts for the surplus arbitrage system
+
+Messages use Telegram's HTML parse mode; dynamic text is HTML-escaped.
 """
 
 import os
+import html
+import bisect
+import random
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 import asyncio
 
-# Try to import telegram library
-try:
-    from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
-    from telegram.constants import ParseMode
-    TELEGRAM_AVAILABLE = True
-except ImportError:
-    TELEGRAM_AVAILABLE = False
-    Bot = None
+# Optional libraries are imported where they're used, so code that only
+# formats messages (AlertFormatter) never loads python-telegram-bot and
+# its httpx/h2/anyio import chain
+TELEGRAM_AVAILABLE = find_spec('telegram') is not None
+HTTPX_AVAILABLE = find_spec('httpx') is not None        # send_message_sync
+TELETHON_AVAILABLE = find_spec('telethon') is not None  # MTProto transport
+UVLOOP_AVAILABLE = find_spec('uvloop') is not None      # background send loop
+
+# HTTP/2 multiplexes sends over one connection when the h2 package is installed
+BOT_HTTP_VERSION = '2' if find_spec('h2') is not None else '1.1'
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Telegram allows a bot roughly 30 messages per second
+SEND_RATE_LIMIT = 30
+
+# Seconds send_sync waits for a message to go out; the send is abandoned
+# (retries included) when it runs out, so a False result never delivers later
+SEND_SYNC_TIMEOUT = 10
+
+# Retries per message on rate limits (429) and transient network/server
+# errors; backoff doubles from the base delay up to the cap (seconds).
+# Timeouts aren't retried (Telegram may already have the message), and a
+# rate-limit wait longer than the cap fails the send instead of stalling it
+SEND_MAX_RETRIES = 4
+SEND_RETRY_BASE_DELAY = 1
+SEND_RETRY_MAX_DELAY = 30
+
+# Bot API endpoint and timeout (seconds) for send_message_sync
+TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+SEND_MESSAGE_SYNC_TIMEOUT = 5
+
+TEST_MESSAGE = "🤖 <b>Albatross Bot Test</b>\n\nBot is connected and working!"
+
+# Connection pool for the bot's long-lived HTTP client (timeouts in seconds)
+BOT_CONNECTION_POOL_SIZE = 64
+BOT_READ_TIMEOUT = 10
+BOT_CONNECT_TIMEOUT = 5
+BOT_POOL_TIMEOUT = 5
+
+# Briefing ROI marker: below 100% ⚪, from 100% ✅, from 200% 🔥
+_ROI_THRESHOLDS = (100, 200)
+_ROI_EMOJIS = ('⚪', '✅', '🔥')
+
+# One morning briefing entry; filled with str.format_map
+BRIEFING_ITEM_TEMPLATE = (
+    "<b>{index}. {title}</b>\n"
+    "   Current: ${current_bid:.0f} | Max: ${max_bid:.0f} | "
+    "Profit: ${estimated_profit:.0f} ({roi_percent:.0f}% ROI) {roi_emoji}\n"
+    "   Ends: {end_time} ({time_remaining})\n"
+    "{warning_line}\n"
+)
+
+
+_http_client: Optional['httpx.Client'] = None
+
+# Shared copies of recurring price_range strings (bounded: ranges vary widely)
+_PRICE_RANGES: Dict[str, str] = {}
+_PRICE_RANGES_MAX = 4096
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """sys.intern for optional strings"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _shared_price_range(price_range: Optional[str]) -> Optional[str]:
+    """Return one shared string object per distinct price range"""
+    if not price_range:
+        return price_range
+    shared = _PRICE_RANGES.get(price_range)
+    if shared is None:
+        if len(_PRICE_RANGES) >= _PRICE_RANGES_MAX:
+            return price_range
+        shared = _PRICE_RANGES.setdefault(price_range, price_range)
+    return shared
+
+
+def _get_http_client() -> 'httpx.Client':
+    """Shared keep-alive client for send_message_sync, created on first use"""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.Client(timeout=SEND_MESSAGE_SYNC_TIMEOUT)
+    return _http_client
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a failed send, or None if it shouldn't be retried"""
+    if TELEGRAM_AVAILABLE:
+        from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
+
+        if isinstance(error, RetryAfter):
+            retry_after = error.retry_after
+            delay = retry_after.total_seconds() if isinstance(retry_after, timedelta) else float(retry_after)
+            return delay if delay <= SEND_RETRY_MAX_DELAY else None
+        # A timed-out send may have been delivered, so resending could duplicate it
+        if isinstance(error, (BadRequest, TimedOut)):
+            return None
+        if isinstance(error, NetworkError):
+            backoff = SEND_RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, SEND_RETRY_BASE_DELAY)
+            return min(backoff, SEND_RETRY_MAX_DELAY)
+
+    if TELETHON_AVAILABLE:
+        from telethon.errors import FloodWaitError
+
+        if isinstance(error, FloodWaitError):
+            return float(error.seconds) if error.seconds <= SEND_RETRY_MAX_DELAY else None
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp ('Z' suffix allowed), cached per raw string"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=1024)
+def _display_date(date_str: str) -> str:
+    """Short display form of an ISO timestamp, e.g. 'Wed 06:00 PM'"""
+    try:
+        return _parse_iso(date_str).strftime("%a %I:%M %p")
+    except (ValueError, TypeError):
+        return date_str
+
+
+def _flip_row(item: Dict) -> str:
+    """Weekly summary line for one sold item"""
+    profit = item.get('actual_profit', 0)
+    emoji = "✅" if profit > 0 else "❌"
+    return (
+        f"{emoji} {html.escape(item.get('title', 'Unknown')[:30])}: "
+        f"${item.get('purchase_price', 0):.0f} → ${item.get('sale_price', 0):.0f} = "
+        f"${profit:.0f} profit"
+    )
+
 
-@dataclass
+def _full_url(surplus_url: str) -> str:
+    """Absolute surplus.gov.ab.ca URL for a possibly site-relative link"""
+    return surplus_url if surplus_url.startswith('http') else f"https://surplus.gov.ab.ca{surplus_url}"
+
+
+# Keyboards are immutable, so identical ones are built once and shared
+@lru_cache(maxsize=2048)
+def _briefing_keyboard(links: Tuple[Tuple[str, str], ...]) -> 'InlineKeyboardMarkup':
+    """Briefing keyboard for (item_id, url) pairs"""
+    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+    buttons = [
+        [
+            InlineKeyboardButton(f"#{i} View", url=url),
+            InlineKeyboardButton(f"Track #{i}", callback_data=f"track_{item_id}")
+        ]
+        for i, (item_id, url) in enumerate(links, 1)
+    ]
+    buttons.append([
+        InlineKeyboardButton("Run New Scan", callback_data="cmd_scanner")
+    ])
+    return InlineKeyboardMarkup(buttons)
+
+
+@lru_cache(maxsize=2048)
+def _opportunity_keyboard(item_id: str, url: str) -> 'InlineKeyboardMarkup':
+    """Strong opportunity keyboard for one item"""
+    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("View Now", url=url),
+            InlineKeyboardButton("Set Reminder", callback_data=f"remind_{item_id}")
+        ],
+        [
+            InlineKeyboardButton("I'm Bidding", callback_data=f"bid_{item_id}"),
+            InlineKeyboardButton("Dismiss", callback_data=f"dismiss_{item_id}")
+        ]
+    ])
+
+
+@lru_cache(maxsize=2048)
+def _auction_ending_keyboard(item_id: str, url: str) -> 'InlineKeyboardMarkup':
+    """Auction ending keyboard for one item"""
+    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("Go Bid Now", url=url),
+            InlineKeyboardButton("Increase Max", callback_data=f"increase_{item_id}")
+        ],
+        [
+            InlineKeyboardButton("Let It Go", callback_data=f"skip_{item_id}")
+        ]
+    ])
+
+
+@dataclass(slots=True, frozen=True)
 class OpportunityData:
-    """Data for an opportunity alert"""
+    """Data for an opportunity alert (immutable, slotted)"""
     item_id: str
     title: str
     current_bid: float
@@ -41,10 +233,83 @@ class OpportunityData:
     price_range: str
     risk_factors: List[str]
 
+    # Derived once at construction
+    full_url: str = field(init=False, repr=False, compare=False)
+    title40: str = field(init=False, repr=False, compare=False)  # briefing title
+    title_html: str = field(init=False, repr=False, compare=False)
+    title40_html: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set via object.__setattr__
+        object.__setattr__(self, 'full_url', _full_url(self.surplus_url))
+        object.__setattr__(self, 'title40', self.title[:40])
+        # Titles HTML-escaped once for the HTML parse mode
+        object.__setattr__(self, 'title_html', html.escape(self.title))
+        object.__setattr__(self, 'title40_html', html.escape(self.title40))
+
+        # Locations and conditions come from a small set of values; share
+        # one string object each across all opportunities
+        object.__setattr__(self, 'pickup_location', _intern(self.pickup_location))
+        object.__setattr__(self, 'condition', _intern(self.condition))
+        object.__setattr__(self, 'price_range', _shared_price_range(self.price_range))
+
 
-class TelegramAlerts:
+class TelethonTransport:
     """
-    Formats and sends Telegram alerts for surplus opportunities.
+    Sends alerts over MTProto with Telethon, signed in as the bot.
+
+    Every message goes over one persistent session instead of a separate
+    HTTPS request to the Bot API. Selected with TELEGRAM_TRANSPORT=mtproto;
+    needs TELEGRAM_API_ID and TELEGRAM_API_HASH from my.telegram.org.
+    """
+
+    def __init__(self, bot_token: str, api_id: int, api_hash: str, session: str = 'albatross-alerts'):
+        from telethon import TelegramClient
+
+        self.bot_token = bot_token
+        self.client = TelegramClient(session, api_id, api_hash)
+
+    async def send(
+        self,
+        chat_id: str,
+        text: str,
+        keyboard: 'InlineKeyboardMarkup' = None,
+        parse_mode: str = 'HTML'
+    ) -> None:
+        """Send one message, connecting on first use"""
+        if not self.client.is_connected():
+            await self.client.start(bot_token=self.bot_token)
+
+        # Numeric chat IDs must be ints for Telethon; usernames stay strings
+        entity = int(chat_id) if str(chat_id).lstrip('-').isdigit() else chat_id
+        await self.client.send_message(
+            entity,
+            text,
+            parse_mode='html' if parse_mode.upper() == 'HTML' else 'md',
+            buttons=self._buttons(keyboard)
+        )
+
+    @staticmethod
+    def _buttons(keyboard: Optional['InlineKeyboardMarkup']):
+        """Convert a python-telegram-bot inline keyboard to Telethon buttons"""
+        if keyboard is None:
+            return None
+
+        from telethon import Button
+
+        return [
+            [
+                Button.url(button.text, button.url) if button.url
+                else Button.inline(button.text, (button.callback_data or '').encode())
+                for button in row
+            ]
+            for row in keyboard.inline_keyboard
+        ]
+
+
+class AlertFormatter:
+    """
+    Formats Telegram alert messages for surplus opportunities (HTML).
 
     Alert types:
     - Morning briefing (Mon/Wed 6:05 AM)
@@ -52,28 +317,25 @@ class TelegramAlerts:
     - Auction ending (15 min before)
     - Bid won/lost
     - Weekly profit summary
+
+    Formatting needs no Telegram libraries; TelegramAlerts adds sending.
     """
 
-    def __init__(self, bot_token: Optional[str] = None, chat_id: Optional[str] = None):
+    def _format_time_remaining(self, auction_end: str, now: Optional[datetime] = None) -> str:
         """
-        Initialize Telegram alerts.
+        Format time remaining until auction ends.
 
-        Args:
-            bot_token: Telegram bot token (or from TELEGRAM_BOT_TOKEN env)
-            chat_id: Chat ID to send to (or from TELEGRAM_CHAT_ID env)
+        Pass now to share one clock reading across many calls; naive
+        datetimes (for now or auction_end) are local time.
         """
-        self.bot_token = bot_token or os.environ.get('TELEGRAM_BOT_TOKEN')
-        self.chat_id = chat_id or os.environ.get('TELEGRAM_CHAT_ID')
-        self.bot = None
-
-        if TELEGRAM_AVAILABLE and self.bot_token:
-            self.bot = Bot(token=self.bot_token)
-
-    def _format_time_remaining(self, auction_end: str) -> str:
-        """Format time remaining until auction ends"""
         try:
-            end_dt = datetime.fromisoformat(auction_end.replace('Z', '+00:00'))
-            now = datetime.now(end_dt.tzinfo) if end_dt.tzinfo else datetime.now()
+            end_dt = _parse_iso(auction_end)
+            if now is None:
+                now = datetime.now()
+            if end_dt.tzinfo:
+                now = now.astimezone()
+            elif now.tzinfo:
+                now = now.astimezone().replace(tzinfo=None)
             delta = end_dt - now
 
             if delta.total_seconds() < 0:
@@ -95,11 +357,7 @@ class TelegramAlerts:
 
     def _format_date(self, date_str: str) -> str:
         """Format date for display"""
-        try:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime("%a %I:%M %p")
-        except (ValueError, TypeError):
-            return date_str
+        return _display_date(date_str)
 
     # ==================== Morning Briefing ====================
 
@@ -126,68 +384,40 @@ class TelegramAlerts:
 
         if not opportunities:
             return (
-                f"🎯 *SURPLUS OPPORTUNITIES - {day_name}, {date_str}*\n\n"
+                f"🎯 <b>SURPLUS OPPORTUNITIES - {day_name}, {date_str}</b>\n\n"
                 f"No opportunities meeting criteria today.\n\n"
                 f"I'll keep scanning on schedule."
             )
 
-        message = f"🎯 *SURPLUS OPPORTUNITIES - {day_name}, {date_str}*\n"
-        message += f"{len(opportunities)} items found from Alberta Gov Surplus\n\n"
-
-        for i, opp in enumerate(opportunities[:5], 1):
-            roi_emoji = "🔥" if opp.roi_percent >= 200 else "✅" if opp.roi_percent >= 100 else "⚪"
-            time_remaining = self._format_time_remaining(opp.auction_end)
-            end_time = self._format_date(opp.auction_end)
-
-            message += f"*{i}. {opp.title[:40]}*\n"
-            message += f"   Current: ${opp.current_bid:.0f} | Max: ${opp.max_bid:.0f} | "
-            message += f"Profit: ${opp.estimated_profit:.0f} ({opp.roi_percent:.0f}% ROI) {roi_emoji}\n"
-            message += f"   Ends: {end_time} ({time_remaining})\n"
-
-            # Add warnings if needed
-            if opp.risk_factors:
-                warning = opp.risk_factors[0][:30]
-                message += f"   ⚠️ {warning}\n"
+        parts = [
+            f"🎯 <b>SURPLUS OPPORTUNITIES - {day_name}, {date_str}</b>\n"
+            f"{len(opportunities)} items found from Alberta Gov Surplus\n\n"
+        ]
 
-            message += "\n"
-
-        message += "─────────────────\n"
-        message += "Reply with item # to track, or tap buttons below"
-
-        return message
-
-    def get_briefing_keyboard(self, opportunities: List[OpportunityData]) -> Optional['InlineKeyboardMarkup']:
-        """
-        Create inline keyboard for briefing.
-
-        Args:
-            opportunities: List of opportunities
-
-        Returns:
-            InlineKeyboardMarkup or None
-        """
-        if not TELEGRAM_AVAILABLE:
-            return None
-
-        buttons = []
+        # One clock reading so every entry's time remaining is consistent
+        now = datetime.now().astimezone()
 
         for i, opp in enumerate(opportunities[:5], 1):
-            buttons.append([
-                InlineKeyboardButton(
-                    f"#{i} View",
-                    url=opp.surplus_url if opp.surplus_url.startswith('http') else f"https://surplus.gov.ab.ca{opp.surplus_url}"
-                ),
-                InlineKeyboardButton(
-                    f"Track #{i}",
-                    callback_data=f"track_{opp.item_id}"
-                )
-            ])
-
-        buttons.append([
-            InlineKeyboardButton("Run New Scan", callback_data="cmd_scanner")
-        ])
-
-        return InlineKeyboardMarkup(buttons)
+            parts.append(BRIEFING_ITEM_TEMPLATE.format_map({
+                'index': i,
+                'title': opp.title40_html,
+                'current_bid': opp.current_bid,
+                'max_bid': opp.max_bid,
+                'estimated_profit': opp.estimated_profit,
+                'roi_percent': opp.roi_percent,
+                'roi_emoji': _ROI_EMOJIS[bisect.bisect_right(_ROI_THRESHOLDS, opp.roi_percent)],
+                'end_time': self._format_date(opp.auction_end),
+                'time_remaining': self._format_time_remaining(opp.auction_end, now),
+                # Add warnings if needed
+                'warning_line': f"   ⚠️ {html.escape(opp.risk_factors[0][:30])}\n" if opp.risk_factors else "",
+            }))
+
+        parts.append(
+            "─────────────────\n"
+            "Reply with item # to track, or tap buttons below"
+        )
+
+        return "".join(parts)
 
     # ==================== Strong Opportunity ====================
 
@@ -204,46 +434,29 @@ class TelegramAlerts:
         time_remaining = self._format_time_remaining(opp.auction_end)
         end_time = self._format_date(opp.auction_end)
 
-        message = "⚡ *STRONG OPPORTUNITY DETECTED*\n\n"
-        message += f"*{opp.title}*\n\n"
-        message += f"Current Bid: ${opp.current_bid:.0f}\n"
-        message += f"Your Max: ${opp.max_bid:.0f}\n"
-        message += f"Potential Profit: ${opp.estimated_profit:.0f} ({opp.roi_percent:.0f}% ROI)\n\n"
-        message += f"Auction ends: {end_time} ({time_remaining})\n"
+        parts = [
+            "⚡ <b>STRONG OPPORTUNITY DETECTED</b>\n\n"
+            f"<b>{opp.title_html}</b>\n\n"
+            f"Current Bid: ${opp.current_bid:.0f}\n"
+            f"Your Max: ${opp.max_bid:.0f}\n"
+            f"Potential Profit: ${opp.estimated_profit:.0f} ({opp.roi_percent:.0f}% ROI)\n\n"
+            f"Auction ends: {end_time} ({time_remaining})\n"
+        ]
 
         if opp.price_range:
-            message += f"eBay Price Range: {opp.price_range}\n"
+            parts.append(f"eBay Price Range: {html.escape(opp.price_range)}\n")
 
         if opp.condition:
-            message += f"Condition: {opp.condition}\n"
+            parts.append(f"Condition: {html.escape(opp.condition)}\n")
 
         if opp.pickup_location:
-            message += f"Pickup: {opp.pickup_location}\n"
+            parts.append(f"Pickup: {html.escape(opp.pickup_location)}\n")
 
         if opp.risk_factors:
-            message += "\n⚠️ *Risk Factors:*\n"
-            for risk in opp.risk_factors[:3]:
-                message += f"  • {risk}\n"
-
-        return message
-
-    def get_opportunity_keyboard(self, opp: OpportunityData) -> Optional['InlineKeyboardMarkup']:
-        """Create keyboard for opportunity alert"""
-        if not TELEGRAM_AVAILABLE:
-            return None
-
-        url = opp.surplus_url if opp.surplus_url.startswith('http') else f"https://surplus.gov.ab.ca{opp.surplus_url}"
+            parts.append("\n⚠️ <b>Risk Factors:</b>\n")
+            parts.extend(f"  • {html.escape(risk)}\n" for risk in opp.risk_factors[:3])
 
-        return InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton("View Now", url=url),
-                InlineKeyboardButton("Set Reminder", callback_data=f"remind_{opp.item_id}")
-            ],
-            [
-                InlineKeyboardButton("I'm Bidding", callback_data=f"bid_{opp.item_id}"),
-                InlineKeyboardButton("Dismiss", callback_data=f"dismiss_{opp.item_id}")
-            ]
-        ])
+        return "".join(parts)
 
     # ==================== Auction Ending ====================
 
@@ -265,39 +478,26 @@ class TelegramAlerts:
         time_remaining = self._format_time_remaining(opp.auction_end)
         actual_bid = current_bid if current_bid else opp.current_bid
 
-        message = "⏰ *AUCTION ENDING SOON*\n\n"
-        message += f"*{opp.title}*\n\n"
-        message += f"Current Bid: ${actual_bid:.0f}"
+        parts = [
+            "⏰ <b>AUCTION ENDING SOON</b>\n\n"
+            f"<b>{opp.title_html}</b>\n\n"
+            f"Current Bid: ${actual_bid:.0f}"
+        ]
 
         if current_bid and current_bid != opp.current_bid:
-            message += f" (was ${opp.current_bid:.0f})"
+            parts.append(f" (was ${opp.current_bid:.0f})")
 
-        message += "\n"
-        message += f"Your Max: ${opp.max_bid:.0f}\n"
-        message += f"Time Left: {time_remaining}\n\n"
+        parts.append(
+            "\n"
+            f"Your Max: ${opp.max_bid:.0f}\n"
+            f"Time Left: {time_remaining}\n\n"
+        )
 
         # Warning if approaching max
         if actual_bid >= opp.max_bid * 0.85:
-            message += "⚠️ *Current bid approaching your max!*\n\n"
-
-        return message
-
-    def get_auction_ending_keyboard(self, opp: OpportunityData) -> Optional['InlineKeyboardMarkup']:
-        """Create keyboard for auction ending alert"""
-        if not TELEGRAM_AVAILABLE:
-            return None
-
-        url = opp.surplus_url if opp.surplus_url.startswith('http') else f"https://surplus.gov.ab.ca{opp.surplus_url}"
+            parts.append("⚠️ <b>Current bid approaching your max!</b>\n\n")
 
-        return InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton("Go Bid Now", url=url),
-                InlineKeyboardButton("Increase Max", callback_data=f"increase_{opp.item_id}")
-            ],
-            [
-                InlineKeyboardButton("Let It Go", callback_data=f"skip_{opp.item_id}")
-            ]
-        ])
+        return "".join(parts)
 
     # ==================== Bid Results ====================
 
@@ -310,22 +510,26 @@ class TelegramAlerts:
         item_id: str
     ) -> str:
         """Format bid won notification"""
-        message = "🎉 *BID WON!*\n\n"
-        message += f"*{title}*\n\n"
-        message += f"Winning Bid: ${winning_bid:.0f}"
+        parts = [
+            "🎉 <b>BID WON!</b>\n\n"
+            f"<b>{html.escape(title)}</b>\n\n"
+            f"Winning Bid: ${winning_bid:.0f}"
+        ]
 
         if winning_bid < max_bid:
-            message += f" (under your ${max_bid:.0f} max)"
+            parts.append(f" (under your ${max_bid:.0f} max)")
 
-        message += "\n"
-        message += f"Pickup: {pickup_location}\n\n"
-        message += "*Next steps:*\n"
-        message += "1. Schedule pickup\n"
-        message += "2. Test thoroughly\n"
-        message += "3. List on eBay/Kijiji\n"
-        message += f"4. Track profit: `/track {item_id}`\n"
+        parts.append(
+            "\n"
+            f"Pickup: {html.escape(pickup_location)}\n\n"
+            "<b>Next steps:</b>\n"
+            "1. Schedule pickup\n"
+            "2. Test thoroughly\n"
+            "3. List on eBay/Kijiji\n"
+            f"4. Track profit: <code>/track {html.escape(item_id)}</code>\n"
+        )
 
-        return message
+        return "".join(parts)
 
     def format_bid_lost(
         self,
@@ -334,17 +538,18 @@ class TelegramAlerts:
         your_max: float
     ) -> str:
         """Format bid lost notification"""
-        message = "😔 *BID LOST*\n\n"
-        message += f"*{title}*\n\n"
-        message += f"Winning Bid: ${winning_bid:.0f}\n"
-        message += f"Your Max: ${your_max:.0f}\n\n"
-
         if winning_bid <= your_max * 1.1:
-            message += "💡 Close one! Consider higher max next time for similar items."
+            verdict = "💡 Close one! Consider higher max next time for similar items."
         else:
-            message += "✅ Good discipline staying under your max."
+            verdict = "✅ Good discipline staying under your max."
 
-        return message
+        return (
+            "😔 <b>BID LOST</b>\n\n"
+            f"<b>{html.escape(title)}</b>\n\n"
+            f"Winning Bid: ${winning_bid:.0f}\n"
+            f"Your Max: ${your_max:.0f}\n\n"
+            f"{verdict}"
+        )
 
     # ==================== Profit Summary ====================
 
@@ -372,38 +577,25 @@ class TelegramAlerts:
         """
         date_range = f"{start_date.strftime('%b %d')}-{end_date.strftime('%d')}, {end_date.year}"
 
-        message = "📊 *WEEKLY PROFIT SUMMARY*\n\n"
-        message += f"{date_range}\n\n"
+        parts = [f"📊 <b>WEEKLY PROFIT SUMMARY</b>\n\n{date_range}\n\n"]
 
         if items_flipped:
-            message += f"*Items Flipped: {len(items_flipped)}*\n"
+            parts.append(f"<b>Items Flipped: {len(items_flipped)}</b>\n")
 
-            for item in items_flipped[:5]:
-                profit = item.get('actual_profit', 0)
-                emoji = "✅" if profit > 0 else "❌"
-                message += f"{emoji} {item.get('title', 'Unknown')[:30]}: "
-                message += f"${item.get('purchase_price', 0):.0f} → ${item.get('sale_price', 0):.0f} = "
-                message += f"${profit:.0f} profit\n"
+            parts.append("\n".join(map(_flip_row, items_flipped[:5])))
 
-            message += f"\n*Total Profit: ${total_profit:.0f}*\n"
-            message += f"Avg ROI: {avg_roi:.0f}%\n"
+            parts.append(
+                f"\n\n<b>Total Profit: ${total_profit:.0f}</b>\n"
+                f"Avg ROI: {avg_roi:.0f}%\n"
+            )
 
         else:
-            message += "No items sold this week.\n"
+            parts.append("No items sold this week.\n")
 
         if monthly_profit > 0:
-            message += f"\nThis Month: ${monthly_profit:.0f}"
-
-        return message
-
-    def get_summary_keyboard(self) -> Optional['InlineKeyboardMarkup']:
-        """Create keyboard for summary"""
-        if not TELEGRAM_AVAILABLE:
-            return None
+            parts.append(f"\nThis Month: ${monthly_profit:.0f}")
 
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("View Full History", callback_data="cmd_history")]
-        ])
+        return "".join(parts)
 
     # ==================== Status Messages ====================
 
@@ -417,15 +609,122 @@ class TelegramAlerts:
         budget_remaining: float
     ) -> str:
         """Format status overview message"""
-        message = "📋 *ALBATROSS STATUS*\n\n"
-        message += f"👁️ Watching: {watching}\n"
-        message += f"🎯 Bid Placed: {bid_placed}\n"
-        message += f"✅ Won (pending): {won}\n"
-        message += f"📦 Pending Pickup: {pending_pickup}\n"
-        message += f"🏷️ Listed: {listed}\n"
-        message += f"\n💰 Budget Remaining: ${budget_remaining:.0f}"
+        return (
+            "📋 <b>ALBATROSS STATUS</b>\n\n"
+            f"👁️ Watching: {watching}\n"
+            f"🎯 Bid Placed: {bid_placed}\n"
+            f"✅ Won (pending): {won}\n"
+            f"📦 Pending Pickup: {pending_pickup}\n"
+            f"🏷️ Listed: {listed}\n"
+            f"\n💰 Budget Remaining: ${budget_remaining:.0f}"
+        )
+
+
+class TelegramAlerts(AlertFormatter):
+    """
+    Formats and sends Telegram alerts for surplus opportunities.
+
+    Adds inline keyboards and sending to AlertFormatter; python-telegram-bot
+    is only imported once a bot token is configured or a keyboard is built.
+    """
+
+    def __init__(self, bot_token: Optional[str] = None, chat_id: Optional[str] = None):
+        """
+        Initialize Telegram alerts.
+
+        Args:
+            bot_token: Telegram bot token (or from TELEGRAM_BOT_TOKEN env)
+            chat_id: Chat ID to send to (or from TELEGRAM_CHAT_ID env)
+        """
+        self.bot_token = bot_token or os.environ.get('TELEGRAM_BOT_TOKEN')
+        self.chat_id = chat_id or os.environ.get('TELEGRAM_CHAT_ID')
+        self.bot = None
+
+        # Background event loop for send_sync, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+        # Sends in progress, so identical messages raised concurrently
+        # (e.g. overlapping cron runs) go out once
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+
+        if TELEGRAM_AVAILABLE and self.bot_token:
+            from telegram import Bot
+            from telegram.request import HTTPXRequest
+
+            # One pooled keep-alive client for every send from this instance
+            request = HTTPXRequest(
+                connection_pool_size=BOT_CONNECTION_POOL_SIZE,
+                read_timeout=BOT_READ_TIMEOUT,
+                connect_timeout=BOT_CONNECT_TIMEOUT,
+                pool_timeout=BOT_POOL_TIMEOUT,
+                http_version=BOT_HTTP_VERSION
+            )
+            self.bot = Bot(token=self.bot_token, request=request)
+
+        # Optional alternative transport with an async send(chat_id, text,
+        # keyboard, parse_mode); None sends through self.bot
+        self.transport = None
+        if os.environ.get('TELEGRAM_TRANSPORT', '').lower() == 'mtproto':
+            self.transport = self._create_mtproto_transport()
+
+    def _create_mtproto_transport(self) -> Optional[TelethonTransport]:
+        """Build the Telethon transport, or None (Bot API fallback) if unavailable"""
+        api_id = os.environ.get('TELEGRAM_API_ID')
+        api_hash = os.environ.get('TELEGRAM_API_HASH')
+
+        if not TELETHON_AVAILABLE:
+            print("TELEGRAM_TRANSPORT=mtproto needs telethon; using the Bot API")
+            return None
+        if not (self.bot_token and api_id and api_hash):
+            print("TELEGRAM_TRANSPORT=mtproto needs TELEGRAM_API_ID and TELEGRAM_API_HASH; using the Bot API")
+            return None
+
+        return TelethonTransport(self.bot_token, int(api_id), api_hash)
+
+    # ==================== Keyboards ====================
+
+    def get_briefing_keyboard(self, opportunities: List[OpportunityData]) -> Optional['InlineKeyboardMarkup']:
+        """
+        Create inline keyboard for briefing.
+
+        Args:
+            opportunities: List of opportunities
+
+        Returns:
+            InlineKeyboardMarkup or None
+        """
+        if not TELEGRAM_AVAILABLE:
+            return None
+
+        return _briefing_keyboard(tuple(
+            (opp.item_id, opp.full_url) for opp in opportunities[:5]
+        ))
+
+    def get_opportunity_keyboard(self, opp: OpportunityData) -> Optional['InlineKeyboardMarkup']:
+        """Create keyboard for opportunity alert"""
+        if not TELEGRAM_AVAILABLE:
+            return None
+
+        return _opportunity_keyboard(opp.item_id, opp.full_url)
+
+    def get_auction_ending_keyboard(self, opp: OpportunityData) -> Optional['InlineKeyboardMarkup']:
+        """Create keyboard for auction ending alert"""
+        if not TELEGRAM_AVAILABLE:
+            return None
+
+        return _auction_ending_keyboard(opp.item_id, opp.full_url)
+
+    def get_summary_keyboard(self) -> Optional['InlineKeyboardMarkup']:
+        """Create keyboard for summary"""
+        if not TELEGRAM_AVAILABLE:
+            return None
 
-        return message
+        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+        return InlineKeyboardMarkup([
+            [InlineKeyboardButton("View Full History", callback_data="cmd_history")]
+        ])
 
     # ==================== Sending ====================
 
@@ -433,36 +732,169 @@ class TelegramAlerts:
         self,
         text: str,
         keyboard: 'InlineKeyboardMarkup' = None,
-        parse_mode: str = 'Markdown'
+        parse_mode: str = 'HTML'
     ) -> bool:
         """
         Send a message via Telegram.
 
+        Rate limits and transient errors are retried with backoff. While a
+        message is being sent, an identical send waits for that result
+        instead of posting it again.
+
+        Args:
+            text: Message text
+            keyboard: Optional inline keyboard
+            parse_mode: Parse mode (HTML/MarkdownV2)
+
+        Returns:
+            True if sent successfully
+        """
+        if not (self.bot or self.transport) or not self.chat_id:
+            print(f"[TELEGRAM] {text[:100]}...")
+            return False
+
+        key = (self.chat_id, text, parse_mode, keyboard)
+        task = self._in_flight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._deliver(text, keyboard, parse_mode))
+            self._in_flight[key] = task
+            task.add_done_callback(
+                lambda done: self._in_flight.pop(key) if self._in_flight.get(key) is done else None
+            )
+
+        # Shielded so one cancelled caller doesn't cancel the send for the others
+        return await asyncio.shield(task)
+
+    async def _deliver(
+        self,
+        text: str,
+        keyboard: Optional['InlineKeyboardMarkup'],
+        parse_mode: str,
+        deadline: Optional[float] = None
+    ) -> bool:
+        """
+        Send one message, retrying rate limits and transient errors.
+        With a deadline (event loop time), a retry that couldn't start
+        before it is given up instead.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(SEND_MAX_RETRIES + 1):
+            try:
+                if self.transport is not None:
+                    await self.transport.send(self.chat_id, text, keyboard, parse_mode)
+                else:
+                    await self.bot.send_message(
+                        chat_id=self.chat_id,
+                        text=text,
+                        parse_mode=parse_mode,
+                        reply_markup=keyboard
+                    )
+                return True
+
+            except Exception as e:
+                delay = _retry_delay(e, attempt)
+                out_of_time = deadline is not None and delay is not None and loop.time() + delay >= deadline
+                if delay is None or attempt == SEND_MAX_RETRIES or out_of_time:
+                    print(f"Telegram send failed: {e}")
+                    return False
+                print(f"Telegram send failed ({e}) - retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+
+        return False
+
+    async def send_many(
+        self,
+        messages: List[Tuple[str, Optional['InlineKeyboardMarkup']]]
+    ) -> List[bool]:
+        """
+        Send several messages concurrently.
+
+        Sends start at most SEND_RATE_LIMIT per second, with at most
+        SEND_RATE_LIMIT in flight, so bursts stay under Telegram's cap.
+
+        Args:
+            messages: (text, keyboard) pairs; keyboard may be None
+
+        Returns:
+            Send result for each message, in input order
+        """
+        semaphore = asyncio.Semaphore(SEND_RATE_LIMIT)
+        interval = 1 / SEND_RATE_LIMIT
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        async def _send_one(index: int, text: str, keyboard) -> bool:
+            # Space request starts evenly rather than firing all at once
+            delay = start + index * interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with semaphore:
+                return await self.send_message(text, keyboard)
+
+        results = await asyncio.gather(
+            *(_send_one(i, text, keyboard) for i, (text, keyboard) in enumerate(messages))
+        )
+        return list(results)
+
+    def send_message_sync(
+        self,
+        text: str,
+        keyboard: 'InlineKeyboardMarkup' = None,
+        parse_mode: str = 'HTML'
+    ) -> bool:
+        """
+        Send a message with one blocking Bot API request, no event loop.
+
+        For one-off sends from scripts and scheduled jobs, where starting
+        an event loop costs more than the request itself.
+
         Args:
             text: Message text
             keyboard: Optional inline keyboard
-            parse_mode: Parse mode (Markdown/HTML)
+            parse_mode: Parse mode (HTML/MarkdownV2)
 
         Returns:
             True if sent successfully
         """
-        if not self.bot or not self.chat_id:
+        if not HTTPX_AVAILABLE or not self.bot_token or not self.chat_id:
             print(f"[TELEGRAM] {text[:100]}...")
             return False
 
+        import httpx
+
+        payload = {'chat_id': self.chat_id, 'text': text, 'parse_mode': parse_mode}
+        if keyboard is not None:
+            payload['reply_markup'] = keyboard.to_dict()
+
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=text,
-                parse_mode=parse_mode,
-                reply_markup=keyboard
+            response = _get_http_client().post(
+                TELEGRAM_API_URL.format(token=self.bot_token),
+                json=payload
             )
+            response.raise_for_status()
             return True
 
-        except Exception as e:
+        except httpx.HTTPError as e:
             print(f"Telegram send failed: {e}")
             return False
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                if UVLOOP_AVAILABLE:
+                    import uvloop
+                    loop = uvloop.new_event_loop()
+                else:
+                    loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="telegram-alerts-loop",
+                    daemon=True
+                ).start()
+                self._loop = loop
+        return self._loop
+
     def send_sync(
         self,
         text: str,
@@ -471,6 +903,13 @@ class TelegramAlerts:
         """
         Synchronous wrapper for sending messages.
 
+        Runs on one long-lived background loop, so the bot's connection
+        pool is reused across calls, and works from inside a running loop.
+
+        Retries are bounded by SEND_SYNC_TIMEOUT and the send is cancelled
+        when it runs out, so a False result is never delivered later.
+        Unlike send_message, identical sends aren't coalesced.
+
         Args:
             text: Message text
             keyboard: Optional keyboard
@@ -478,12 +917,35 @@ class TelegramAlerts:
         Returns:
             True if sent
         """
+        future = asyncio.run_coroutine_threadsafe(
+            self._send_within(text, keyboard, SEND_SYNC_TIMEOUT), self._get_loop()
+        )
+        try:
+            # _send_within returns by its own timeout; this only guards a stuck loop
+            return future.result(timeout=SEND_SYNC_TIMEOUT + 1)
+        except FutureTimeoutError:
+            future.cancel()
+            print(f"Telegram send timed out after {SEND_SYNC_TIMEOUT}s")
+            return False
+
+    async def _send_within(
+        self,
+        text: str,
+        keyboard: Optional['InlineKeyboardMarkup'],
+        timeout: float
+    ) -> bool:
+        """Send with retries bounded by timeout seconds, cancelling the send at the timeout"""
+        if not (self.bot or self.transport) or not self.chat_id:
+            return await self.send_message(text, keyboard)
+
+        deadline = asyncio.get_running_loop().time() + timeout
         try:
-            return asyncio.run(self.send_message(text, keyboard))
-        except RuntimeError:
-            # Already in an async context
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(self.send_message(text, keyboard))
+            return await asyncio.wait_for(
+                self._deliver(text, keyboard, 'HTML', deadline=deadline), timeout
+            )
+        except asyncio.TimeoutError:
+            print(f"Telegram send timed out after {timeout}s")
+            return False
 
     async def send_morning_briefing(self, opportunities: List[OpportunityData]) -> bool:
         """Send morning briefing"""
@@ -497,6 +959,13 @@ class TelegramAlerts:
         keyboard = self.get_opportunity_keyboard(opp)
         return await self.send_message(text, keyboard)
 
+    async def send_strong_opportunities(self, opps: List[OpportunityData]) -> List[bool]:
+        """Send strong opportunity alerts for several items concurrently"""
+        return await self.send_many([
+            (self.format_strong_opportunity(opp), self.get_opportunity_keyboard(opp))
+            for opp in opps
+        ])
+
     async def send_auction_ending(self, opp: OpportunityData, current_bid: float = None) -> bool:
         """Send auction ending reminder"""
         text = self.format_auction_ending(opp, current_bid)
@@ -505,8 +974,7 @@ class TelegramAlerts:
 
     async def send_test_message(self) -> bool:
         """Send a test message to verify bot works"""
-        text = "🤖 *Albatross Bot Test*\n\nBot is connected and working!"
-        return await self.send_message(text)
+        return await self.send_message(TEST_MESSAGE)
 
 
 def main():
@@ -515,7 +983,7 @@ def main():
     print("Telegram Alerts Test")
     print("=" * 50)
 
-    alerts = TelegramAlerts()
+    alerts = AlertFormatter()
 
     # Test opportunity
     opp = OpportunityData(
@@ -561,10 +1029,11 @@ def main():
     ))
 
     # Test sending if credentials available
-    if alerts.bot and alerts.chat_id:
+    alerts = TelegramAlerts()
+    if alerts.bot_token and alerts.chat_id:
         print("\n--- Sending Test Message ---")
-        asyncio.run(alerts.send_test_message())
-        print("Test message sent!")
+        if alerts.send_message_sync(TEST_MESSAGE):
+            print("Test message sent!")
     else:
         print("\n[No Telegram credentials - messages printed only]")
 
@@ -6,11 +6,20 @@ Mobile interface for surplus arbitrage system
 
 import os
 import sys
+import time
+import copy
+import html
 import logging
+import re
 import asyncio
+import importlib
+import threading
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 
 # Try to import telegram library
 try:
@@ -21,6 +30,8 @@ try:
         CallbackQueryHandler,
         MessageHandler,
         ContextTypes,
+        Defaults,
+        AIORateLimiter,
         filters
     )
     TELEGRAM_AVAILABLE = True
@@ -35,16 +46,57 @@ except ImportError:
     CallbackQueryHandler = Any
     MessageHandler = Any
     ContextTypes = type('ContextTypes', (), {'DEFAULT_TYPE': Any})
+    Defaults = Any
+    AIORateLimiter = Any
     filters = None
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.utils.bid_tracker import BidTracker
 from src.interfaces.telegram_alerts import TelegramAlerts, OpportunityData
 
+# Scan pipeline for /scanner, imported on first use (see __getattr__) so
+# --test and the other commands don't load scraping dependencies
+_SCAN_CLASSES = {
+    'SurplusScanner': 'src.surplus.scanner',
+    'ApifyEbayResearcher': 'src.surplus.ebay_research_apify',
+    'ROICalculator': 'src.surplus.calculator',
+}
+
+
+def __getattr__(name: str):
+    """Import a scan pipeline class on first access and keep it as a module global"""
+    module = _SCAN_CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def _scan_classes() -> Tuple[type, type, type]:
+    """(SurplusScanner, ApifyEbayResearcher, ROICalculator), importing them if needed"""
+    module = sys.modules[__name__]
+    return module.SurplusScanner, module.ApifyEbayResearcher, module.ROICalculator
+
+
+def _prewarm_scanner_imports():
+    """Import the scan pipeline ahead of the first /scanner"""
+    try:
+        _scan_classes()
+    except ImportError as e:
+        logger.warning(f"Scanner unavailable: {e}")
+
+
 # Set up logging
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -52,6 +104,112 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Outgoing message limits, just under Telegram's caps of 30 messages/second
+# overall and 20 messages/minute per group. AIORateLimiter needs aiolimiter
+# (python-telegram-bot[rate-limiter])
+RATE_LIMITER_AVAILABLE = find_spec('aiolimiter') is not None
+RATE_LIMIT_OVERALL = 28
+RATE_LIMIT_GROUP_PER_MINUTE = 18
+
+# Seconds a tracker summary read (stats, budget, profit) is reused for
+TRACKER_CACHE_TTL = 3
+
+# Minimum seconds between error replies to one chat
+ERROR_REPLY_INTERVAL = 5
+
+# Dollar amount argument: 45, $45 or $45.50
+_MONEY_RE = re.compile(r'^\$?(\d+(?:\.\d+)?)$')
+
+# /status marker per item status (📦 for any other) and /history
+# marker indexed by whether the flip made a profit
+_STATUS_EMOJI = MappingProxyType({'watching': '👁️', 'bid_placed': '🎯', 'won': '✅'})
+_PROFIT_EMOJI = ("❌", "✅")
+
+# Fixed command replies (Markdown)
+WELCOME_TEXT = """
+🎯 *ALBATROSS SURPLUS BOT*
+
+Your mobile arbitrage assistant.
+
+*Commands:*
+/scanner - Run manual scan
+/status - View tracked items
+/profit - See earnings
+/budget - Spending limits
+/help - All commands
+
+*You'll receive alerts for:*
+• Monday/Wednesday opportunities
+• High ROI items (100%+)
+• Auctions ending soon
+
+Ready to find profitable flips!
+"""
+
+HELP_TEXT = """
+📖 *ALBATROSS COMMANDS*
+
+*Scanning & Discovery:*
+/scanner - Run surplus scan now
+/status - See all tracked items
+
+*Bidding:*
+/track <id> - Track a surplus item
+/bid <id> $XX - Log your max bid
+/won <id> - Mark item as won
+/lost <id> - Mark item as lost
+
+*After Winning:*
+/pickup <id> - Mark as picked up
+/listed <id> - Mark as listed for sale
+/sold <id> $XX - Record sale price
+
+*Finances:*
+/profit - This month's earnings
+/history - Completed flips
+/budget - View weekly budget
+/budget $XXX - Set weekly budget
+
+*Settings:*
+/alerts on|off - Toggle notifications
+
+*Examples:*
+`/bid surplus_001 $45`
+`/sold surplus_001 $120`
+`/budget $500`
+"""
+
+ALERTS_HELP_TEXT = (
+    "*Alert Settings*\n\n"
+    "Use `/alerts on` or `/alerts off`\n\n"
+    "You'll receive:\n"
+    "• Morning briefings (Mon/Wed)\n"
+    "• Strong opportunities (100%+ ROI)\n"
+    "• Auction ending reminders"
+)
+
+TRACK_USAGE = "Usage: `/track <item_id>`\nExample: `/track surplus_001`"
+BID_USAGE = "Usage: `/bid <item_id> $XX`\nExample: `/bid surplus_001 $45`"
+SOLD_USAGE = "Usage: `/sold <item_id> $XX [fees]`\nExample: `/sold surplus_001 $120 $15`"
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict:
+    """Parse a YAML config file; keyed on mtime so edits are picked up"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def _parse_money(text: str) -> Optional[float]:
+    """Parse a dollar amount argument, or None if it isn't one"""
+    match = _MONEY_RE.match(text)
+    return float(match.group(1)) if match else None
+
+
+def _fmt_money(value: Optional[float]) -> str:
+    """Whole-dollar amount, or $? when it's unknown"""
+    return f"${value:.0f}" if value is not None else "$?"
+
 
 class AlbatrossBot:
     """
@@ -70,6 +228,18 @@ class AlbatrossBot:
     - /alerts - Toggle notifications
     """
 
+    # Button callback data -> handler method: exact matches first, then
+    # '<action>_<item_id>' by action
+    _CALLBACK_EXACT = {
+        'cmd_scanner': '_cb_cmd_scanner',
+        'cmd_history': '_cb_cmd_history',
+    }
+    _CALLBACK_ACTIONS = {
+        'track': '_cb_track',
+        'bid': '_cb_bid',
+        'dismiss': '_cb_dismiss',
+    }
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize Albatross bot.
@@ -85,115 +255,101 @@ class AlbatrossBot:
         self.tracker = BidTracker()
         self.alerts = TelegramAlerts(self.bot_token, self.chat_id)
 
+        # Scan pipeline components, created on the first /scanner; the lock
+        # keeps scans from different chats from sharing the scanner at once
+        self._scanner: Optional['SurplusScanner'] = None
+        self._researcher: Optional['ApifyEbayResearcher'] = None
+        self._scan_lock = threading.Lock()
+
         # Application placeholder
         self.app: Optional['Application'] = None
 
+        # Recent tracker summary reads: (method, args) -> (value, expiry)
+        self._tracker_cache: Dict[tuple, Tuple[Any, float]] = {}
+
+        # When each chat last got an error reply (time.monotonic())
+        self._last_error_reply: Dict[int, float] = {}
+
         # User state tracking
         self.user_states: Dict[int, Dict] = {}
 
+        # Per-chat locks: updates run concurrently across chats but in
+        # order within one chat
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load configuration from YAML file"""
         if config_path is None:
             config_path = Path(__file__).parent.parent.parent / "config" / "telegram.yaml"
 
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            path = Path(config_path).resolve()
+            config = _load_config_cached(str(path), path.stat().st_mtime_ns)
         except FileNotFoundError:
             logger.warning(f"Config not found at {config_path}, using defaults")
             return {}
 
+        # Copy so one bot can't change the cached config seen by another
+        return copy.deepcopy(config)
+
+    def _tracker_read(self, method: str, *args, **kwargs):
+        """Call a read-only BidTracker method, reusing a result younger than TRACKER_CACHE_TTL"""
+        key = (method, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        cached = self._tracker_cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        value = getattr(self.tracker, method)(*args, **kwargs)
+        self._tracker_cache[key] = (value, now + TRACKER_CACHE_TTL)
+        return value
+
+    def _invalidate_tracker_cache(self):
+        """Drop cached tracker reads after the bot changes tracked items or budget"""
+        self._tracker_cache.clear()
+
+    async def _dispatch(self, chat_id: int, handler, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Run a handler once earlier updates from the same chat have finished"""
+        lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        async with lock:
+            return await handler(update, context)
+
+    def _per_chat(self, handler):
+        """Wrap a handler so it's serialized per chat"""
+        @wraps(handler)
+        async def wrapped(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            chat = update.effective_chat
+            if chat is None:
+                return await handler(update, context)
+            return await self._dispatch(chat.id, handler, update, context)
+
+        return wrapped
+
     # ==================== Command Handlers ====================
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        welcome_text = """
-🎯 *ALBATROSS SURPLUS BOT*
-
-Your mobile arbitrage assistant.
-
-*Commands:*
-/scanner - Run manual scan
-/status - View tracked items
-/profit - See earnings
-/budget - Spending limits
-/help - All commands
-
-*You'll receive alerts for:*
-• Monday/Wednesday opportunities
-• High ROI items (100%+)
-• Auctions ending soon
-
-Ready to find profitable flips!
-        """
-        await update.message.reply_text(welcome_text, parse_mode='Markdown')
+        await update.message.reply_text(WELCOME_TEXT, parse_mode='Markdown')
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        help_text = """
-📖 *ALBATROSS COMMANDS*
-
-*Scanning & Discovery:*
-/scanner - Run surplus scan now
-/status - See all tracked items
-
-*Bidding:*
-/track <id> - Track a surplus item
-/bid <id> $XX - Log your max bid
-/won <id> - Mark item as won
-/lost <id> - Mark item as lost
-
-*After Winning:*
-/pickup <id> - Mark as picked up
-/listed <id> - Mark as listed for sale
-/sold <id> $XX - Record sale price
-
-*Finances:*
-/profit - This month's earnings
-/history - Completed flips
-/budget - View weekly budget
-/budget $XXX - Set weekly budget
-
-*Settings:*
-/alerts on|off - Toggle notifications
-
-*Examples:*
-`/bid surplus_001 $45`
-`/sold surplus_001 $120`
-`/budget $500`
-        """
-        await update.message.reply_text(help_text, parse_mode='Markdown')
+        await update.message.reply_text(HELP_TEXT, parse_mode='Markdown')
 
     async def scanner_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /scanner command - run surplus scan"""
-        await update.message.reply_text("🔍 Starting surplus scan...")
+        # Progress message, edited in place with the outcome
+        progress = await update.message.reply_text("🔍 Starting surplus scan...")
 
         try:
-            # Import and run scanner
-            from src.surplus.scanner import SurplusScanner
-            from src.surplus.ebay_research_apify import ApifyEbayResearcher
-            from src.surplus.calculator import ROICalculator
-
-            scanner = SurplusScanner()
-            items = scanner.scan(test_mode=False)  # Live data from surplus website
+            # Scraping and research block, so run them off the event loop
+            items, actionable = await asyncio.to_thread(self._run_scan)
 
             if not items:
-                await update.message.reply_text("No items found in Calgary area.")
+                await progress.edit_text("No items found in Calgary area.")
                 return
 
-            # Research items
-            researcher = ApifyEbayResearcher()
-            research_data = researcher.research_batch(items, test_mode=False)
-
-            # Calculate ROI
-            calculator = ROICalculator()
-            results = calculator.calculate_batch(items, research_data)
-
-            # Get actionable items
-            actionable = calculator.get_actionable_items()
-
             if not actionable:
-                await update.message.reply_text(
+                await progress.edit_text(
                     f"✅ Scanned {len(items)} items\n"
                     f"No opportunities meeting ROI threshold."
                 )
@@ -201,8 +357,9 @@ Ready to find profitable flips!
 
             # Format opportunities
             opportunities = []
+            items_by_id = {i.item_id: i for i in items}
             for result in actionable[:5]:
-                item = next((i for i in items if i.item_id == result.item_id), None)
+                item = items_by_id.get(result.item_id)
                 if item:
                     opp = OpportunityData(
                         item_id=result.item_id,
@@ -236,73 +393,101 @@ Ready to find profitable flips!
                         'auction_end': item.auction_end,
                         'status': 'watching'
                     })
+                    self._invalidate_tracker_cache()
 
             # Send formatted briefing
             text = self.alerts.format_morning_briefing(opportunities)
             keyboard = self.alerts.get_briefing_keyboard(opportunities)
 
-            await update.message.reply_text(text, parse_mode='Markdown', reply_markup=keyboard)
+            await progress.edit_text(text, parse_mode='HTML', reply_markup=keyboard)
 
         except Exception as e:
             import traceback
             tb = traceback.format_exc()
             logger.error(f"Scanner error: {e}\n{tb}")
             print(f"FULL TRACEBACK:\n{tb}")
-            await update.message.reply_text(f"❌ Scan failed: {str(e)[:100]}")
+            await progress.edit_text(f"❌ Scan failed: {str(e)[:100]}")
+
+    def _run_scan(self) -> Tuple[List, List]:
+        """Scan, research and score items; returns (items, actionable results)"""
+        SurplusScanner, ApifyEbayResearcher, ROICalculator = _scan_classes()
+
+        with self._scan_lock:
+            if self._scanner is None:
+                self._scanner = SurplusScanner()
+            items = self._scanner.scan(test_mode=False)  # Live data from surplus website
+
+            if not items:
+                return items, []
+
+            # Research items; research_batch batches queries into actor
+            # runs and parallelizes the rest itself
+            if self._researcher is None:
+                self._researcher = ApifyEbayResearcher()
+            research_data = self._researcher.research_batch(items, test_mode=False)
+
+        # Calculate ROI (a fresh calculator per scan: it holds that scan's results)
+        calculator = ROICalculator()
+        calculator.calculate_batch(items, research_data)
+
+        return items, calculator.get_actionable_items()
 
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command"""
-        stats = self.tracker.get_stats()
-        budget = self.tracker.get_budget()
-        spent = self.tracker.get_weekly_spent()
+        stats = self._tracker_read('get_stats')
+        budget = self._tracker_read('get_budget')
+        spent = self._tracker_read('get_weekly_spent')
 
-        text = self.alerts.format_status(
+        parts = [self.alerts.format_status(
             watching=stats.get('watching', 0),
             bid_placed=stats.get('bid_placed', 0),
             won=stats.get('won', 0),
             pending_pickup=stats.get('picked_up', 0),
             listed=stats.get('listed', 0),
             budget_remaining=budget['weekly_budget'] - spent
-        )
+        )]
 
         # Add active items
-        active = self.tracker.get_active_bids()
+        active = self._tracker_read('get_active_bids')
         if active:
-            text += "\n\n*Active Items:*\n"
+            parts.append("\n\n<b>Active Items:</b>\n")
             for item in active[:5]:
-                emoji = {'watching': '👁️', 'bid_placed': '🎯', 'won': '✅'}.get(item['status'], '📦')
-                text += f"{emoji} {item['title'][:30]}... (${item['max_bid']:.0f})\n"
+                emoji = _STATUS_EMOJI.get(item['status'], '📦')
+                parts.append(f"{emoji} {html.escape(item['title'][:30])}... ({_fmt_money(item.get('max_bid'))})\n")
 
-        await update.message.reply_text(text, parse_mode='Markdown')
+        await update.message.reply_text("".join(parts), parse_mode='HTML')
 
     async def profit_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /profit command"""
         # Get current month profit
-        monthly = self.tracker.get_monthly_profit()
-        summary = self.tracker.get_profit_summary(days=30)
-
-        text = "📊 *PROFIT SUMMARY*\n\n"
+        monthly = self._tracker_read('get_monthly_profit')
+        summary = self._tracker_read('get_profit_summary', days=30)
 
         # This month
         month_name = datetime.now().strftime("%B %Y")
-        text += f"*{month_name}:*\n"
-        text += f"Items Sold: {monthly['items_sold']}\n"
-        text += f"Total Profit: ${monthly['total_profit']:.0f}\n"
-        text += f"Total Invested: ${monthly['total_invested']:.0f}\n"
+        parts = [
+            "📊 *PROFIT SUMMARY*\n\n"
+            f"*{month_name}:*\n"
+            f"Items Sold: {monthly['items_sold']}\n"
+            f"Total Profit: {_fmt_money(monthly['total_profit'])}\n"
+            f"Total Invested: {_fmt_money(monthly['total_invested'])}\n"
+        ]
 
         if monthly['items_sold'] > 0:
-            text += f"Avg ROI: {monthly['avg_roi']:.0f}%\n"
+            parts.append(f"Avg ROI: {monthly['avg_roi']:.0f}%\n")
 
         # Last 30 days detail
-        text += f"\n*Last 30 Days:*\n"
-        text += f"Revenue: ${summary['total_revenue']:.0f}\n"
-        text += f"Fees: ${summary['total_fees']:.0f}\n"
-        text += f"Net Profit: ${summary['total_profit']:.0f}\n"
+        parts.append(
+            "\n*Last 30 Days:*\n"
+            f"Revenue: {_fmt_money(summary['total_revenue'])}\n"
+            f"Fees: {_fmt_money(summary['total_fees'])}\n"
+            f"Net Profit: {_fmt_money(summary['total_profit'])}\n"
+        )
 
         if summary['avg_days_to_sell'] > 0:
-            text += f"Avg Days to Sell: {summary['avg_days_to_sell']:.0f}\n"
+            parts.append(f"Avg Days to Sell: {summary['avg_days_to_sell']:.0f}\n")
 
-        await update.message.reply_text(text, parse_mode='Markdown')
+        await update.message.reply_text("".join(parts), parse_mode='Markdown')
 
     async def budget_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /budget command"""
@@ -310,26 +495,29 @@ Ready to find profitable flips!
 
         if args and args[0].startswith('$'):
             # Set new budget
-            try:
-                new_budget = float(args[0].replace('$', ''))
-                self.tracker.set_budget(weekly_budget=new_budget)
-                await update.message.reply_text(f"✅ Weekly budget set to ${new_budget:.0f}")
-                return
-            except ValueError:
+            new_budget = _parse_money(args[0])
+            if new_budget is None:
                 await update.message.reply_text("❌ Invalid amount. Use: /budget $500")
                 return
 
+            self.tracker.set_budget(weekly_budget=new_budget)
+            self._invalidate_tracker_cache()
+            await update.message.reply_text(f"✅ Weekly budget set to ${new_budget:.0f}")
+            return
+
         # Show current budget
-        budget = self.tracker.get_budget()
-        spent = self.tracker.get_weekly_spent()
+        budget = self._tracker_read('get_budget')
+        spent = self._tracker_read('get_weekly_spent')
         remaining = budget['weekly_budget'] - spent
 
-        text = "💰 *BUDGET STATUS*\n\n"
-        text += f"Weekly Budget: ${budget['weekly_budget']:.0f}\n"
-        text += f"Spent This Week: ${spent:.0f}\n"
-        text += f"Remaining: ${remaining:.0f}\n"
-        text += f"\nMax Single Bid: ${budget['max_single_bid']:.0f}\n"
-        text += f"\nTo change: `/budget $XXX`"
+        text = (
+            "💰 *BUDGET STATUS*\n\n"
+            f"Weekly Budget: ${budget['weekly_budget']:.0f}\n"
+            f"Spent This Week: ${spent:.0f}\n"
+            f"Remaining: ${remaining:.0f}\n"
+            f"\nMax Single Bid: ${budget['max_single_bid']:.0f}\n"
+            "\nTo change: `/budget $XXX`"
+        )
 
         await update.message.reply_text(text, parse_mode='Markdown')
 
@@ -338,28 +526,26 @@ Ready to find profitable flips!
         args = context.args
 
         if not args:
-            await update.message.reply_text(
-                "Usage: `/track <item_id>`\n"
-                "Example: `/track surplus_001`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(TRACK_USAGE, parse_mode='Markdown')
             return
 
         item_id = args[0]
         item = self.tracker.get_item(item_id)
 
         if item:
-            text = f"📦 *{item['title']}*\n\n"
-            text += f"Status: {item['status']}\n"
-            text += f"Current Bid: ${item['current_bid']:.0f}\n"
-            text += f"Your Max: ${item['max_bid']:.0f}\n"
-            text += f"Est. Profit: ${item['estimated_profit']:.0f}\n"
-            text += f"ROI: {item['roi_percent']:.0f}%\n"
+            parts = [
+                f"📦 *{item['title']}*\n\n"
+                f"Status: {item['status']}\n"
+                f"Current Bid: {_fmt_money(item.get('current_bid'))}\n"
+                f"Your Max: {_fmt_money(item.get('max_bid'))}\n"
+                f"Est. Profit: {_fmt_money(item.get('estimated_profit'))}\n"
+                f"ROI: {item['roi_percent']:.0f}%\n"
+            ]
 
             if item['auction_end']:
-                text += f"\nAuction Ends: {item['auction_end'][:16]}"
+                parts.append(f"\nAuction Ends: {item['auction_end'][:16]}")
 
-            await update.message.reply_text(text, parse_mode='Markdown')
+            await update.message.reply_text("".join(parts), parse_mode='Markdown')
         else:
             await update.message.reply_text(f"❌ Item `{item_id}` not found", parse_mode='Markdown')
 
@@ -368,17 +554,12 @@ Ready to find profitable flips!
         args = context.args
 
         if len(args) < 2:
-            await update.message.reply_text(
-                "Usage: `/bid <item_id> $XX`\n"
-                "Example: `/bid surplus_001 $45`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(BID_USAGE, parse_mode='Markdown')
             return
 
         item_id = args[0]
-        try:
-            max_bid = float(args[1].replace('$', ''))
-        except ValueError:
+        max_bid = _parse_money(args[1])
+        if max_bid is None:
             await update.message.reply_text("❌ Invalid bid amount")
             return
 
@@ -387,6 +568,7 @@ Ready to find profitable flips!
             'max_bid': max_bid,
             'status': 'bid_placed'
         })
+        self._invalidate_tracker_cache()
 
         if success:
             item = self.tracker.get_item(item_id)
@@ -404,6 +586,7 @@ Ready to find profitable flips!
                 'max_bid': max_bid,
                 'status': 'bid_placed'
             })
+            self._invalidate_tracker_cache()
             await update.message.reply_text(f"✅ New item tracked with max bid ${max_bid:.0f}")
 
     async def won_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -415,13 +598,19 @@ Ready to find profitable flips!
             return
 
         item_id = args[0]
-        purchase_price = float(args[1].replace('$', '')) if len(args) > 1 else None
+        purchase_price = None
+        if len(args) > 1:
+            purchase_price = _parse_money(args[1])
+            if purchase_price is None:
+                await update.message.reply_text("❌ Invalid amount")
+                return
 
         updates = {'status': 'won'}
         if purchase_price:
             updates['purchase_price'] = purchase_price
 
         success = self.tracker.update_item(item_id, updates)
+        self._invalidate_tracker_cache()
 
         if success:
             await update.message.reply_text(
@@ -442,6 +631,7 @@ Ready to find profitable flips!
 
         item_id = args[0]
         success = self.tracker.update_status(item_id, 'lost')
+        self._invalidate_tracker_cache()
 
         if success:
             await update.message.reply_text("😔 Item marked as LOST. On to the next one!")
@@ -458,6 +648,7 @@ Ready to find profitable flips!
 
         item_id = args[0]
         success = self.tracker.update_status(item_id, 'picked_up')
+        self._invalidate_tracker_cache()
 
         if success:
             await update.message.reply_text(
@@ -479,6 +670,7 @@ Ready to find profitable flips!
 
         item_id = args[0]
         success = self.tracker.update_status(item_id, 'listed')
+        self._invalidate_tracker_cache()
 
         if success:
             await update.message.reply_text(
@@ -494,22 +686,18 @@ Ready to find profitable flips!
         args = context.args
 
         if len(args) < 2:
-            await update.message.reply_text(
-                "Usage: `/sold <item_id> $XX [fees]`\n"
-                "Example: `/sold surplus_001 $120 $15`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(SOLD_USAGE, parse_mode='Markdown')
             return
 
         item_id = args[0]
-        try:
-            sale_price = float(args[1].replace('$', ''))
-            fees = float(args[2].replace('$', '')) if len(args) > 2 else 0
-        except ValueError:
+        sale_price = _parse_money(args[1])
+        fees = _parse_money(args[2]) if len(args) > 2 else 0
+        if sale_price is None or fees is None:
             await update.message.reply_text("❌ Invalid amount")
             return
 
         success = self.tracker.record_sale(item_id, sale_price, fees)
+        self._invalidate_tracker_cache()
 
         if success:
             item = self.tracker.get_item(item_id)
@@ -535,21 +723,21 @@ Ready to find profitable flips!
             await update.message.reply_text("No completed flips yet.")
             return
 
-        text = "📜 *FLIP HISTORY*\n\n"
-
-        total_profit = 0
-        for item in sold_items[:10]:
-            profit = item.get('actual_profit', 0)
-            total_profit += profit
-            emoji = "✅" if profit > 0 else "❌"
-
-            text += f"{emoji} *{item['title'][:30]}*\n"
-            text += f"   ${item.get('purchase_price', 0):.0f} → ${item.get('sale_price', 0):.0f} = "
-            text += f"${profit:.0f}\n"
-
-        text += f"\n*Total: ${total_profit:.0f}*"
+        # Total covers every sold flip; only the first 10 are listed
+        profits = [item.get('actual_profit', 0) for item in sold_items]
+        total_profit = sum(profits)
+
+        parts = ["📜 *FLIP HISTORY*\n\n"]
+        for item, profit in zip(sold_items[:10], profits):
+            emoji = _PROFIT_EMOJI[profit > 0]
+            parts.append(
+                f"{emoji} *{item['title'][:30]}*\n"
+                f"   ${item.get('purchase_price', 0):.0f} → ${item.get('sale_price', 0):.0f} = "
+                f"${profit:.0f}\n"
+            )
+        parts.append(f"\n*Total: ${total_profit:.0f}*")
 
-        await update.message.reply_text(text, parse_mode='Markdown')
+        await update.message.reply_text("".join(parts), parse_mode='Markdown')
 
     async def alerts_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /alerts command"""
@@ -560,15 +748,7 @@ Ready to find profitable flips!
             # Store in config or user preferences
             await update.message.reply_text(f"✅ Alerts turned {state}")
         else:
-            await update.message.reply_text(
-                "*Alert Settings*\n\n"
-                "Use `/alerts on` or `/alerts off`\n\n"
-                "You'll receive:\n"
-                "• Morning briefings (Mon/Wed)\n"
-                "• Strong opportunities (100%+ ROI)\n"
-                "• Auction ending reminders",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(ALERTS_HELP_TEXT, parse_mode='Markdown')
 
     # ==================== Callback Handlers ====================
 
@@ -578,30 +758,42 @@ Ready to find profitable flips!
         await query.answer()
 
         data = query.data
+        arg = None
+        handler = self._CALLBACK_EXACT.get(data)
+        if handler is None:
+            action, _, arg = data.partition('_')
+            handler = self._CALLBACK_ACTIONS.get(action)
 
-        if data.startswith('track_'):
-            item_id = data.replace('track_', '')
-            item = self.tracker.get_item(item_id)
-            if item:
-                await query.edit_message_text(
-                    f"✅ Now tracking: {item['title'][:40]}...\n"
-                    f"Use `/bid {item_id} $XX` to log your max bid",
-                    parse_mode='Markdown'
-                )
+        if handler is not None:
+            await getattr(self, handler)(query, arg)
+
+    async def _cb_track(self, query, item_id: str):
+        """Track button: confirm tracking and show how to log a bid"""
+        item = self.tracker.get_item(item_id)
+        if item:
+            await query.edit_message_text(
+                f"✅ Now tracking: {item['title'][:40]}...\n"
+                f"Use `/bid {item_id} $XX` to log your max bid",
+                parse_mode='Markdown'
+            )
 
-        elif data.startswith('bid_'):
-            item_id = data.replace('bid_', '')
-            self.tracker.update_status(item_id, 'bid_placed')
-            await query.edit_message_text(f"✅ Marked as bidding on {item_id}")
+    async def _cb_bid(self, query, item_id: str):
+        """I'm Bidding button: mark the item as bid placed"""
+        self.tracker.update_status(item_id, 'bid_placed')
+        self._invalidate_tracker_cache()
+        await query.edit_message_text(f"✅ Marked as bidding on {item_id}")
 
-        elif data.startswith('dismiss_'):
-            await query.edit_message_text("✅ Dismissed")
+    async def _cb_dismiss(self, query, item_id: str):
+        """Dismiss button"""
+        await query.edit_message_text("✅ Dismissed")
 
-        elif data == 'cmd_scanner':
-            await query.edit_message_text("Running scan... use /scanner")
+    async def _cb_cmd_scanner(self, query, arg: Optional[str]):
+        """Run New Scan button"""
+        await query.edit_message_text("Running scan... use /scanner")
 
-        elif data == 'cmd_history':
-            await query.edit_message_text("Use /history to see completed flips")
+    async def _cb_cmd_history(self, query, arg: Optional[str]):
+        """View Full History button"""
+        await query.edit_message_text("Use /history to see completed flips")
 
     # ==================== Error Handler ====================
 
@@ -609,10 +801,24 @@ Ready to find profitable flips!
         """Handle errors"""
         logger.error(f"Update {update} caused error {context.error}")
 
-        if update and update.effective_message:
+        if not (update and update.effective_message):
+            return
+
+        # At most one error reply per chat every ERROR_REPLY_INTERVAL seconds,
+        # so a failing dependency can't turn every update into another send
+        chat_id = update.effective_message.chat_id
+        now = time.monotonic()
+        if now - self._last_error_reply.get(chat_id, float('-inf')) < ERROR_REPLY_INTERVAL:
+            return
+        self._last_error_reply[chat_id] = now
+
+        try:
             await update.effective_message.reply_text(
-                "❌ An error occurred. Please try again."
+                "❌ An error occurred. Please try again.",
+                disable_notification=True
             )
+        except Exception as e:
+            logger.warning(f"Could not send error reply: {e}")
 
     # ==================== Application Setup ====================
 
@@ -624,33 +830,63 @@ Ready to find profitable flips!
         if not self.bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN not set")
 
-        self.app = Application.builder().token(self.bot_token).build()
+        # Updates are processed concurrently and handlers run as their own
+        # tasks (block=False); _per_chat keeps each chat in order
+        builder = (
+            Application.builder()
+            .token(self.bot_token)
+            .concurrent_updates(True)
+            .defaults(Defaults(block=False))
+            .post_init(self._post_init)
+        )
+
+        # Throttle sends (and retry flood waits) instead of hitting 429s
+        if RATE_LIMITER_AVAILABLE:
+            builder = builder.rate_limiter(AIORateLimiter(
+                overall_max_rate=RATE_LIMIT_OVERALL,
+                overall_time_period=1,
+                group_max_rate=RATE_LIMIT_GROUP_PER_MINUTE,
+                group_time_period=60
+            ))
+        else:
+            logger.warning("aiolimiter not installed - sending without a rate limiter")
+
+        self.app = builder.build()
 
         # Add command handlers
-        self.app.add_handler(CommandHandler("start", self.start_command))
-        self.app.add_handler(CommandHandler("help", self.help_command))
-        self.app.add_handler(CommandHandler("scanner", self.scanner_command))
-        self.app.add_handler(CommandHandler("status", self.status_command))
-        self.app.add_handler(CommandHandler("profit", self.profit_command))
-        self.app.add_handler(CommandHandler("budget", self.budget_command))
-        self.app.add_handler(CommandHandler("track", self.track_command))
-        self.app.add_handler(CommandHandler("bid", self.bid_command))
-        self.app.add_handler(CommandHandler("won", self.won_command))
-        self.app.add_handler(CommandHandler("lost", self.lost_command))
-        self.app.add_handler(CommandHandler("pickup", self.pickup_command))
-        self.app.add_handler(CommandHandler("listed", self.listed_command))
-        self.app.add_handler(CommandHandler("sold", self.sold_command))
-        self.app.add_handler(CommandHandler("history", self.history_command))
-        self.app.add_handler(CommandHandler("alerts", self.alerts_command))
+        commands = {
+            "start": self.start_command,
+            "help": self.help_command,
+            "scanner": self.scanner_command,
+            "status": self.status_command,
+            "profit": self.profit_command,
+            "budget": self.budget_command,
+            "track": self.track_command,
+            "bid": self.bid_command,
+            "won": self.won_command,
+            "lost": self.lost_command,
+            "pickup": self.pickup_command,
+            "listed": self.listed_command,
+            "sold": self.sold_command,
+            "history": self.history_command,
+            "alerts": self.alerts_command,
+        }
+        for command, handler in commands.items():
+            self.app.add_handler(CommandHandler(command, self._per_chat(handler)))
 
         # Add callback handler for buttons
-        self.app.add_handler(CallbackQueryHandler(self.button_callback))
+        self.app.add_handler(CallbackQueryHandler(self._per_chat(self.button_callback)))
 
         # Add error handler
         self.app.add_error_handler(self.error_handler)
 
         return self.app
 
+    async def _post_init(self, application: 'Application'):
+        """Start background work once the bot is up"""
+        # Import the scan pipeline ahead of the first /scanner
+        application.create_task(asyncio.to_thread(_prewarm_scanner_imports))
+
     def run(self):
         """Run the bot"""
         if not self.app:
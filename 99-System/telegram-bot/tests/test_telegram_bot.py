@@ -252,6 +252,31 @@ class TestTelegramAlerts(unittest.TestCase):
         self.assertIn('155%', message)
         self.assertIn('Risk Factors', message)
 
+    def test_format_escapes_html(self):
+        """Test dynamic text is HTML-escaped for the HTML parse mode"""
+        from dataclasses import replace
+
+        opp = replace(self.sample_opportunity, title='Cisco <SG300> & Switch_28')
+        message = self.alerts.format_strong_opportunity(opp)
+
+        self.assertIn('<b>Cisco &lt;SG300&gt; &amp; Switch_28</b>', message)
+
+    def test_opportunity_is_immutable(self):
+        """Test OpportunityData is frozen and has no per-instance dict"""
+        from dataclasses import FrozenInstanceError
+
+        with self.assertRaises(FrozenInstanceError):
+            self.sample_opportunity.current_bid = 99.0
+        self.assertFalse(hasattr(self.sample_opportunity, '__dict__'))
+
+    def test_opportunity_full_url(self):
+        """Test site-relative surplus URLs are made absolute once"""
+        from dataclasses import replace
+
+        self.assertEqual(self.sample_opportunity.full_url, 'https://surplus.gov.ab.ca/item/12345')
+        relative = replace(self.sample_opportunity, surplus_url='/OA/ItemDetail.aspx?AuctionID=7')
+        self.assertEqual(relative.full_url, 'https://surplus.gov.ab.ca/OA/ItemDetail.aspx?AuctionID=7')
+
     def test_format_auction_ending(self):
         """Test auction ending alert formatting"""
         message = self.alerts.format_auction_ending(self.sample_opportunity, current_bid=55.00)
@@ -345,6 +370,193 @@ class TestTelegramAlerts(unittest.TestCase):
         result = self.alerts._format_time_remaining(past)
         self.assertEqual(result, 'Ended')
 
+    def test_time_remaining_with_snapshot(self):
+        """Test time remaining against a caller-supplied clock reading"""
+        from datetime import timezone
+
+        now = datetime(2026, 3, 4, 12, 0, tzinfo=timezone.utc)
+        self.assertEqual(
+            self.alerts._format_time_remaining('2026-03-04T13:30:00Z', now), '1h 30m'
+        )
+        self.assertEqual(
+            self.alerts._format_time_remaining('2026-03-04T11:00:00+00:00', now), 'Ended'
+        )
+
+    def test_format_date(self):
+        """Test date display formatting, including cached repeats"""
+        self.assertEqual(self.alerts._format_date('2026-03-04T18:00:00'), 'Wed 06:00 PM')
+        self.assertEqual(self.alerts._format_date('2026-03-04T18:00:00Z'), 'Wed 06:00 PM')
+        self.assertEqual(self.alerts._format_date('2026-03-04T18:00:00'), 'Wed 06:00 PM')
+
+        # Unparseable dates are shown as-is
+        self.assertEqual(self.alerts._format_date('soon'), 'soon')
+
+    def test_send_strong_opportunities(self):
+        """Test batched alert sending keeps order and sends every message"""
+        import asyncio
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.chat_id = '12345'
+        opps = [self.sample_opportunity] * 3
+
+        results = asyncio.run(self.alerts.send_strong_opportunities(opps))
+
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(self.alerts.bot.send_message.await_count, 3)
+
+    def test_send_sync_reuses_loop(self):
+        """Test send_sync sends on one persistent background loop"""
+        self.alerts.bot = AsyncMock()
+        self.alerts.chat_id = '12345'
+
+        self.assertTrue(self.alerts.send_sync('first'))
+        loop = self.alerts._loop
+        self.assertTrue(self.alerts.send_sync('second'))
+
+        self.assertIs(self.alerts._loop, loop)
+        self.assertEqual(self.alerts.bot.send_message.await_count, 2)
+
+    def test_send_sync_gives_up_within_timeout(self):
+        """Test send_sync abandons a send that can't finish in time"""
+        from src.interfaces.telegram_alerts import TELEGRAM_AVAILABLE
+        if not TELEGRAM_AVAILABLE:
+            self.skipTest("python-telegram-bot not installed")
+        from telegram.error import RetryAfter
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.bot.send_message.side_effect = [RetryAfter(60), None]
+        self.alerts.chat_id = '12345'
+
+        # A 60s wait can't fit in the timeout, so no retry is ever made
+        self.assertFalse(self.alerts.send_sync('hello'))
+        self.assertEqual(self.alerts.bot.send_message.await_count, 1)
+
+    def test_send_sync_cancels_on_timeout(self):
+        """Test a send still running at the timeout is cancelled"""
+        import asyncio
+
+        async def hang(**kwargs):
+            await asyncio.sleep(60)
+
+        async def other_tasks():
+            await asyncio.sleep(0)
+            return len(asyncio.all_tasks() - {asyncio.current_task()})
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.bot.send_message.side_effect = hang
+        self.alerts.chat_id = '12345'
+
+        with patch('src.interfaces.telegram_alerts.SEND_SYNC_TIMEOUT', 0.1):
+            self.assertFalse(self.alerts.send_sync('hello'))
+        pending = asyncio.run_coroutine_threadsafe(other_tasks(), self.alerts._loop).result(1)
+        self.assertEqual(pending, 0)
+
+    def test_send_via_transport(self):
+        """Test a configured transport is used instead of the Bot API"""
+        import asyncio
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.transport = MagicMock()
+        self.alerts.transport.send = AsyncMock()
+        self.alerts.chat_id = '12345'
+
+        self.assertTrue(asyncio.run(self.alerts.send_message('hello')))
+
+        self.alerts.transport.send.assert_awaited_once_with('12345', 'hello', None, 'HTML')
+        self.alerts.bot.send_message.assert_not_awaited()
+
+    def test_send_retries_rate_limit(self):
+        """Test a rate-limited send is retried after the requested delay"""
+        import asyncio
+        from src.interfaces.telegram_alerts import TELEGRAM_AVAILABLE
+        if not TELEGRAM_AVAILABLE:
+            self.skipTest("python-telegram-bot not installed")
+        from telegram.error import RetryAfter
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.bot.send_message.side_effect = [RetryAfter(3), None]
+        self.alerts.chat_id = '12345'
+
+        with patch('src.interfaces.telegram_alerts.asyncio.sleep', new=AsyncMock()) as sleep:
+            self.assertTrue(asyncio.run(self.alerts.send_message('hello')))
+
+        self.assertEqual(self.alerts.bot.send_message.await_count, 2)
+        sleep.assert_awaited_once_with(3.0)
+
+    def test_send_gives_up_on_long_rate_limit(self):
+        """Test a rate-limit wait over SEND_RETRY_MAX_DELAY fails the send without waiting"""
+        import asyncio
+        from src.interfaces.telegram_alerts import TELEGRAM_AVAILABLE, SEND_RETRY_MAX_DELAY
+        if not TELEGRAM_AVAILABLE:
+            self.skipTest("python-telegram-bot not installed")
+        from telegram.error import RetryAfter
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.bot.send_message.side_effect = [RetryAfter(SEND_RETRY_MAX_DELAY + 1), None]
+        self.alerts.chat_id = '12345'
+
+        with patch('src.interfaces.telegram_alerts.asyncio.sleep', new=AsyncMock()) as sleep:
+            self.assertFalse(asyncio.run(self.alerts.send_message('hello')))
+
+        self.alerts.bot.send_message.assert_awaited_once()
+        sleep.assert_not_awaited()
+
+    def test_send_does_not_retry_timeout(self):
+        """Test a timed-out send isn't resent, since Telegram may have delivered it"""
+        import asyncio
+        from src.interfaces.telegram_alerts import TELEGRAM_AVAILABLE
+        if not TELEGRAM_AVAILABLE:
+            self.skipTest("python-telegram-bot not installed")
+        from telegram.error import NetworkError, TimedOut
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.bot.send_message.side_effect = [TimedOut(), None]
+        self.alerts.chat_id = '12345'
+
+        with patch('src.interfaces.telegram_alerts.asyncio.sleep', new=AsyncMock()):
+            self.assertFalse(asyncio.run(self.alerts.send_message('hello')))
+            self.alerts.bot.send_message.assert_awaited_once()
+
+            # Other network errors are still retried
+            self.alerts.bot.send_message.reset_mock()
+            self.alerts.bot.send_message.side_effect = [NetworkError('connection reset'), None]
+            self.assertTrue(asyncio.run(self.alerts.send_message('hello')))
+            self.assertEqual(self.alerts.bot.send_message.await_count, 2)
+
+    def test_send_coalesces_duplicates(self):
+        """Test identical concurrent sends share one API call"""
+        import asyncio
+
+        self.alerts.bot = AsyncMock()
+        self.alerts.chat_id = '12345'
+
+        async def send_twice():
+            return await asyncio.gather(
+                self.alerts.send_message('hello'),
+                self.alerts.send_message('hello')
+            )
+
+        self.assertEqual(asyncio.run(send_twice()), [True, True])
+        self.alerts.bot.send_message.assert_awaited_once()
+        self.assertEqual(self.alerts._in_flight, {})
+
+    @patch('src.interfaces.telegram_alerts._get_http_client')
+    def test_send_message_sync(self, mock_client):
+        """Test blocking send posts straight to the Bot API"""
+        from src.interfaces.telegram_alerts import HTTPX_AVAILABLE
+        if not HTTPX_AVAILABLE:
+            self.skipTest("httpx not installed")
+
+        self.alerts.bot_token = '123:abc'
+        self.alerts.chat_id = '12345'
+
+        self.assertTrue(self.alerts.send_message_sync('hello'))
+
+        mock_client.return_value.post.assert_called_once_with(
+            'https://api.telegram.org/bot123:abc/sendMessage',
+            json={'chat_id': '12345', 'text': 'hello', 'parse_mode': 'HTML'}
+        )
+
 
 class TestBotCommands(unittest.TestCase):
     """Test bot command handlers (mocked)"""
@@ -357,8 +569,286 @@ class TestBotCommands(unittest.TestCase):
             '/pickup', '/listed', '/sold', '/history', '/alerts'
         ]
 
-        # This is a placeholder - in real tests we'd check the actual help output
+        from src.interfaces.telegram_bot import HELP_TEXT
+
         self.assertEqual(len(help_commands), 13)
+        for command in help_commands:
+            self.assertIn(command, HELP_TEXT)
+
+    def test_load_config_cached(self):
+        """Test config is parsed once and re-read after the file changes"""
+        import tempfile
+        from src.interfaces.telegram_bot import _load_config_cached
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "telegram.yaml"
+            path.write_text("alerts:\n  enabled: true\n")
+            stat = path.stat()
+
+            first = _load_config_cached(str(path), stat.st_mtime_ns)
+            self.assertIs(_load_config_cached(str(path), stat.st_mtime_ns), first)
+
+            path.write_text("alerts:\n  enabled: false\n")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            updated = _load_config_cached(str(path), path.stat().st_mtime_ns)
+            self.assertFalse(updated['alerts']['enabled'])
+
+    def test_per_chat_dispatch(self):
+        """Test updates run in order within a chat and concurrently across chats"""
+        import asyncio
+        from src.interfaces.telegram_bot import AlbatrossBot
+
+        with patch('src.interfaces.telegram_bot.BidTracker'):
+            bot = AlbatrossBot()
+
+        events = []
+
+        async def handler(update, context):
+            events.append(('start', update.effective_chat.id))
+            await asyncio.sleep(0.01)
+            events.append(('end', update.effective_chat.id))
+
+        wrapped = bot._per_chat(handler)
+
+        def update_for(chat_id):
+            update = MagicMock()
+            update.effective_chat.id = chat_id
+            return update
+
+        async def run():
+            await asyncio.gather(wrapped(update_for(1), None), wrapped(update_for(1), None))
+            events.append('---')
+            await asyncio.gather(wrapped(update_for(1), None), wrapped(update_for(2), None))
+
+        asyncio.run(run())
+
+        same_chat, other_chats = events[:4], events[5:]
+        self.assertEqual(same_chat, [('start', 1), ('end', 1), ('start', 1), ('end', 1)])
+        self.assertEqual(other_chats[:2], [('start', 1), ('start', 2)])
+
+    def test_run_scan_researches_in_one_batch(self):
+        """Test a scan hands every item to a single research_batch call"""
+        from src.interfaces.telegram_bot import AlbatrossBot
+
+        with patch('src.interfaces.telegram_bot.BidTracker'):
+            bot = AlbatrossBot()
+
+        items = [MagicMock(item_id=f'item{n}') for n in range(25)]
+        scanner_cls, researcher_cls, calculator_cls = MagicMock(), MagicMock(), MagicMock()
+        scanner_cls.return_value.scan.return_value = items
+        researcher_cls.return_value.research_batch.return_value = {'item0': 'research'}
+        calculator_cls.return_value.get_actionable_items.return_value = ['result']
+
+        with patch('src.interfaces.telegram_bot._scan_classes',
+                   return_value=(scanner_cls, researcher_cls, calculator_cls)):
+            self.assertEqual(bot._run_scan(), (items, ['result']))
+
+        researcher_cls.return_value.research_batch.assert_called_once_with(items, test_mode=False)
+        calculator_cls.return_value.calculate_batch.assert_called_once_with(items, {'item0': 'research'})
+
+    def test_tracker_read_cache(self):
+        """Test summary reads are reused until the bot writes to the tracker"""
+        from src.interfaces.telegram_bot import AlbatrossBot
+
+        with patch('src.interfaces.telegram_bot.BidTracker'):
+            bot = AlbatrossBot()
+        bot.tracker.get_budget.return_value = {'weekly_budget': 500}
+
+        self.assertEqual(bot._tracker_read('get_budget'), {'weekly_budget': 500})
+        bot._tracker_read('get_budget')
+        bot.tracker.get_budget.assert_called_once()
+
+        bot._invalidate_tracker_cache()
+        bot._tracker_read('get_budget')
+        self.assertEqual(bot.tracker.get_budget.call_count, 2)
+
+    def test_parse_money(self):
+        """Test dollar amount arguments"""
+        from src.interfaces.telegram_bot import _parse_money
+
+        self.assertEqual(_parse_money('$45'), 45.0)
+        self.assertEqual(_parse_money('45.50'), 45.5)
+        self.assertIsNone(_parse_money('$45abc'))
+        self.assertIsNone(_parse_money('-5'))
+        self.assertIsNone(_parse_money('$'))
+
+    def test_error_reply_throttled(self):
+        """Test repeated errors in one chat get a single reply"""
+        import asyncio
+        from src.interfaces.telegram_bot import AlbatrossBot
+
+        with patch('src.interfaces.telegram_bot.BidTracker'):
+            bot = AlbatrossBot()
+
+        update = MagicMock()
+        update.effective_message.chat_id = 12345
+        update.effective_message.reply_text = AsyncMock()
+        context = MagicMock()
+
+        async def fail_twice():
+            await bot.error_handler(update, context)
+            await bot.error_handler(update, context)
+
+        asyncio.run(fail_twice())
+        update.effective_message.reply_text.assert_awaited_once()
+
+
+class _FakeApifyDataset:
+    """Dataset client stand-in serving canned entries"""
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def iterate_items(self, limit=None):
+        return iter(self.entries[:limit])
+
+
+class _FakeApifyClient:
+    """ApifyClient stand-in; 'Widget model N' sells for $N0"""
+
+    def __init__(self, multi_query=True, default_query=None):
+        self.multi_query = multi_query
+        # Set to mimic an actor that drops 'queries' and runs its own query
+        self.default_query = default_query
+        self.runs = []
+        self.datasets = {}
+
+    def actor(self, actor_id):
+        return self
+
+    def call(self, run_input):
+        self.runs.append(run_input)
+        if 'queries' in run_input and not self.multi_query:
+            raise RuntimeError("Input is not valid: field 'query' is required")
+        queries = run_input.get('queries') or [run_input['query']]
+        if 'queries' in run_input and self.default_query:
+            queries = [self.default_query]
+        dataset_id = str(len(self.runs))
+        self.datasets[dataset_id] = _FakeApifyDataset([
+            {'query': q, 'summary': {'recommendedPrice': {'display': f"${q.split()[-1]}0.00"}}}
+            for q in queries
+        ])
+        return {'defaultDatasetId': dataset_id}
+
+    def dataset(self, dataset_id):
+        return self.datasets[dataset_id]
+
+
+class TestApifyResearcher(unittest.TestCase):
+    """Tests for batched Apify research and its result cache"""
+
+    def setUp(self):
+        import tempfile
+        from src.surplus.ebay_research_apify import ApifyEbayResearcher
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, "research-cache")
+        self.researcher = ApifyEbayResearcher(cache_path=self.cache_path)
+        self.researcher.client = _FakeApifyClient()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _item(self, item_id, title):
+        from src.surplus.scanner import SurplusItem
+        return SurplusItem(
+            item_id=item_id, title=title, description='', category='Electronics',
+            category_id=1, condition='Used', current_bid=10.0, min_bid=None,
+            num_bids=0, auction_end='', location='Calgary', pickup_location='Calgary',
+            url='', image_url=None, scraped_at=''
+        )
+
+    def test_batch_multi_query_runs(self):
+        """Test distinct queries share actor runs and map back to their items"""
+        items = [self._item(f'w{n}', f'Widget model {n}') for n in range(1, 13)]
+        # Same model in another lot shares the lookup
+        items.append(self._item('w1-again', 'Widget model 1 (E)'))
+
+        results = self.researcher.research_batch(items)
+
+        runs = self.researcher.client.runs
+        self.assertEqual([len(run['queries']) for run in runs], [10, 2])
+        self.assertEqual(list(results), [item.item_id for item in items])
+        for n in range(1, 13):
+            self.assertEqual(results[f'w{n}'].recommended_price, n * 10)
+        self.assertEqual(results['w1-again'].item_id, 'w1-again')
+        self.assertEqual(results['w1-again'].recommended_price, 10)
+        self.assertTrue(self.researcher.multi_query)
+
+        # A second batch is served from the cache without any runs
+        again = self.researcher.research_batch(items[:3])
+        self.assertEqual(len(runs), 2)
+        self.assertEqual([r.item_id for r in again.values()], ['w1', 'w2', 'w3'])
+        self.assertEqual(again['w3'].recommended_price, 30)
+
+    def test_batch_multi_query_failure_falls_back(self):
+        """Test a rejected multi-query run turns batching off and researches per item"""
+        self.researcher.client = _FakeApifyClient(multi_query=False)
+        items = [self._item(f'w{n}', f'Widget model {n}') for n in range(1, 4)]
+
+        results = self.researcher.research_batch(items)
+
+        self.assertFalse(self.researcher.multi_query)
+        self.assertEqual({r.recommended_price for r in results.values()}, {10, 20, 30})
+        runs = self.researcher.client.runs
+        self.assertEqual(sum('queries' in run for run in runs), 1)
+        self.assertEqual(sorted(run['query'] for run in runs[1:]),
+                         ['Widget model 1', 'Widget model 2', 'Widget model 3'])
+
+        # Later batches go straight to per-item runs
+        self.researcher.research_batch([self._item('w4', 'Widget model 4'),
+                                        self._item('w5', 'Widget model 5')])
+        self.assertEqual(sum('queries' in run for run in runs), 1)
+
+    def test_batch_unmatched_multi_query_falls_back(self):
+        """Test a multi-query run answering none of its queries turns batching off"""
+        self.researcher.client = _FakeApifyClient(default_query='iphone')
+        items = [self._item(f'w{n}', f'Widget model {n}') for n in range(1, 13)]
+
+        results = self.researcher.research_batch(items)
+
+        self.assertFalse(self.researcher.multi_query)
+        self.assertEqual(len(results), 12)
+        self.assertEqual(results['w12'].recommended_price, 120)
+        runs = self.researcher.client.runs
+        self.assertEqual(sum('queries' in run for run in runs), 1)
+        self.assertEqual(len(runs), 13)
+
+    def test_cache_hit_uses_caller_item_id(self):
+        """Test a cached result is reused for another item with the same query"""
+        first = self.researcher.research_item(self._item('a', 'Widget model 7'))
+        second = self.researcher.research_item(self._item('b', 'widget MODEL 7 surplus'))
+
+        self.assertEqual(len(self.researcher.client.runs), 1)
+        self.assertEqual((first.item_id, second.item_id), ('a', 'b'))
+        self.assertEqual(second.recommended_price, first.recommended_price)
+        self.assertEqual(second.data_age_days, 0)
+
+    def test_cache_persists_and_expires(self):
+        """Test cached results survive a new researcher and expire after CACHE_TTL"""
+        import time
+        from src.surplus.ebay_research_apify import ApifyEbayResearcher
+
+        self.researcher.research_item(self._item('a', 'Widget model 7'))
+
+        reopened = ApifyEbayResearcher(cache_path=self.cache_path)
+        reopened.client = _FakeApifyClient()
+        stored_at, research = reopened._cache_get(reopened._cache_key('Widget model 7'))
+        self.assertEqual(research.recommended_price, 70)
+
+        # Two days on, the hit reports its age
+        with patch('src.surplus.ebay_research_apify.time.time',
+                   return_value=stored_at + 2 * 86400 + 1):
+            aged = reopened.research_item(self._item('b', 'Widget model 7'))
+        self.assertEqual(aged.data_age_days, 2)
+        self.assertEqual(reopened.client.runs, [])
+
+        # Past the TTL the entry is ignored and the query re-run
+        with patch('src.surplus.ebay_research_apify.time.time',
+                   return_value=stored_at + reopened.CACHE_TTL + 1):
+            self.assertIsNone(reopened._cache_get(reopened._cache_key('Widget model 7')))
+            reopened.research_item(self._item('c', 'Widget model 7'))
+        self.assertEqual(len(reopened.client.runs), 1)
 
 
 class TestIntegration(unittest.TestCase):
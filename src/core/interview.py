@@ -8,7 +8,170 @@ MVP: Template-based with keyword detection.
 Future: AI-generated contextual questions.
 """
 
-from typing import List, Dict
+import re
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Tuple
+
+# Optional C-implemented Aho-Corasick automaton for keyword scanning
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Domain keywords in priority order - first domain with a hit wins
+DOMAIN_KEYWORDS = (
+    ("web_scraping", ("scrape", "crawl", "extract", "spider")),
+    ("automation", ("automate", "bot", "cron", "schedule")),
+    ("data_analysis", ("analyze", "dashboard", "visualize", "metrics")),
+    ("api_integration", ("api", "integrate", "webhook", "connect")),
+)
+
+# Word-count thresholds for "medium" and "complex" ideas
+SIMPLE_WORD_COUNT = 20
+COMPLEX_WORD_COUNT = 50
+
+# Keywords reported back in analyze_idea()["keywords"]
+REPORTED_KEYWORDS = ("scrape", "automate", "api", "dashboard", "bot")
+
+_ALL_KEYWORDS = tuple(dict.fromkeys(
+    [k for _, words in DOMAIN_KEYWORDS for k in words] + list(REPORTED_KEYWORDS)
+))
+
+# Keyword -> index of its domain in DOMAIN_KEYWORDS (lower = higher priority)
+_DOMAIN_RANK = {
+    k: rank for rank, (_, words) in enumerate(DOMAIN_KEYWORDS) for k in words
+}
+
+
+def _build_automaton():
+    """Build the keyword automaton once at import (None if unavailable)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _trie_pattern(words) -> str:
+    """Build a regex alternation from a character trie of words."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _node_pattern(node) -> str:
+        branches = [re.escape(char) + _node_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        optional = "" in node
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    return _node_pattern(trie)
+
+
+_KEYWORD_AUTOMATON = _build_automaton()
+
+# Fallback: one compiled trie-regex; the lookahead reports overlapping hits
+_KEYWORD_RE = re.compile("(?=(" + _trie_pattern(_ALL_KEYWORDS) + "))")
+
+
+def find_keywords(text: str) -> set:
+    """Return every known keyword occurring in (lowercased) text, in one pass."""
+    # map/itemgetter and findall keep the per-match loop in C
+    if _KEYWORD_AUTOMATON is not None:
+        return set(map(itemgetter(1), _KEYWORD_AUTOMATON.iter(text)))
+    return set(_KEYWORD_RE.findall(text))
+
+
+# Question classifier for summarize_requirements(). Each alternative is a
+# lookahead anchored at the start, so alternatives are tried in priority
+# order and m.lastgroup names the first requirement field that applies.
+_QUESTION_RE = re.compile(
+    r"(?=.*(?P<data_fields>fields))"
+    r"|(?=.*(?P<sources>websites|sources))"
+    r"|(?=.*(?P<output_format>format))"
+    r"|(?=.*(?P<frequency>often|frequency))"
+    r"|(?=.*(?P<constraints>constraint))",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+# One comma-separated item, already stripped of surrounding whitespace
+_LIST_ITEM_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+def _split_list(answer: str) -> List[str]:
+    return _LIST_ITEM_RE.findall(answer)
+
+
+def _set_data_fields(requirements: Dict, answer: str) -> None:
+    requirements["data_fields"] = _split_list(answer)
+
+
+def _set_sources(requirements: Dict, answer: str) -> None:
+    requirements["sources"] = _split_list(answer)
+
+
+def _set_output_format(requirements: Dict, answer: str) -> None:
+    requirements["output_format"] = answer
+
+
+def _set_frequency(requirements: Dict, answer: str) -> None:
+    requirements["frequency"] = answer
+
+
+def _add_constraint(requirements: Dict, answer: str) -> None:
+    requirements["constraints"].append(answer)
+
+
+_REQUIREMENT_HANDLERS = {
+    "data_fields": _set_data_fields,
+    "sources": _set_sources,
+    "output_format": _set_output_format,
+    "frequency": _set_frequency,
+    "constraints": _add_constraint,
+}
+
+
+@lru_cache(maxsize=1024)
+def _analyze(source_idea: str) -> Tuple[str, str, Tuple[str, ...], str]:
+    """
+    Cached core of InterviewGenerator.analyze_idea().
+
+    Returns an immutable (domain, complexity, keywords, inferred_intent)
+    tuple so repeat calls with the same idea skip the keyword scan.
+    """
+    idea_lower = source_idea.lower()
+
+    # Single scan for all keywords; domain and keywords both come from it
+    found = find_keywords(idea_lower)
+    rank = min((_DOMAIN_RANK[k] for k in found if k in _DOMAIN_RANK),
+               default=None)
+    domain = DOMAIN_KEYWORDS[rank][0] if rank is not None else "general"
+
+    # Complexity based on length/description. Splitting stops once the top
+    # threshold is reached, so long ideas don't materialize every word.
+    word_count = len(idea_lower.split(maxsplit=COMPLEX_WORD_COUNT))
+    if word_count < SIMPLE_WORD_COUNT:
+        complexity = "simple"
+    elif word_count < COMPLEX_WORD_COUNT:
+        complexity = "medium"
+    else:
+        complexity = "complex"
+
+    # Extract keywords from the same scan
+    keywords = tuple(w for w in REPORTED_KEYWORDS if w in found)
+
+    return domain, complexity, keywords, f"Build a {domain.replace('_', ' ')} tool"
 
 
 class InterviewGenerator:
@@ -18,43 +181,43 @@ class InterviewGenerator:
     Future: AI-generated contextual questions.
     """
 
-    # Question templates by domain
+    # Question templates by domain (immutable, at most 5 per domain)
     QUESTIONS = {
-        "web_scraping": [
+        "web_scraping": (
             "What specific data fields do you need extracted?",
             "Which websites or data sources should we target?",
             "How often should this scraper run? (once, daily, real-time)",
             "What format for output? (CSV, JSON, database, etc.)",
             "Any login/authentication required for the target sites?"
-        ],
-        "automation": [
+        ),
+        "automation": (
             "What triggers this automation? (schedule, event, manual)",
             "What are the input sources or data inputs?",
             "What actions should happen on success?",
             "What should happen on failure? (retry, alert, stop)",
             "Who or what receives the output or notification?"
-        ],
-        "data_analysis": [
+        ),
+        "data_analysis": (
             "What are the data sources?",
             "What metrics or calculations are needed?",
             "Any visualization requirements? (charts, dashboards)",
             "How often should analysis update?",
             "What export formats are needed? (PDF, Excel, etc.)"
-        ],
-        "api_integration": [
+        ),
+        "api_integration": (
             "Which external APIs or services to integrate?",
             "What authentication method? (API key, OAuth, etc.)",
             "What data to send/receive?",
             "Rate limits or quotas to respect?",
             "Error handling requirements?"
-        ],
-        "general": [
+        ),
+        "general": (
             "What problem does this solve?",
             "Who is the primary user?",
             "What are the 3 most important features?",
             "Any hard constraints? (time, budget, tech stack)",
             "How will you know this is successful?"
-        ]
+        )
     }
 
     def analyze_idea(self, source_idea: str) -> Dict:
@@ -69,41 +232,16 @@ class InterviewGenerator:
                 "inferred_intent": str
             }
         """
-        idea_lower = source_idea.lower()
-
-        # Domain detection
-        if any(k in idea_lower for k in ["scrape", "crawl", "extract", "spider"]):
-            domain = "web_scraping"
-        elif any(k in idea_lower for k in ["automate", "bot", "cron", "schedule"]):
-            domain = "automation"
-        elif any(k in idea_lower for k in ["analyze", "dashboard", "visualize", "metrics"]):
-            domain = "data_analysis"
-        elif any(k in idea_lower for k in ["api", "integrate", "webhook", "connect"]):
-            domain = "api_integration"
-        else:
-            domain = "general"
-
-        # Complexity based on length/description
-        word_count = len(idea_lower.split())
-        if word_count < 20:
-            complexity = "simple"
-        elif word_count < 50:
-            complexity = "medium"
-        else:
-            complexity = "complex"
-
-        # Extract keywords (simple)
-        keywords = [w for w in ["scrape", "automate", "api", "dashboard", "bot"]
-                   if w in idea_lower]
+        domain, complexity, keywords, inferred_intent = _analyze(source_idea)
 
         return {
             "domain": domain,
             "complexity": complexity,
-            "keywords": keywords,
-            "inferred_intent": f"Build a {domain.replace('_', ' ')} tool"
+            "keywords": list(keywords),
+            "inferred_intent": inferred_intent
         }
 
-    def generate_questions(self, source_idea: str) -> List[str]:
+    def generate_questions(self, source_idea: str) -> Tuple[str, ...]:
         """
         Generate interview questions based on idea.
 
@@ -111,16 +249,13 @@ class InterviewGenerator:
             source_idea: The bookmark/idea text
 
         Returns:
-            List of question strings (3-5 questions)
+            Tuple of question strings (3-5 questions)
         """
         analysis = self.analyze_idea(source_idea)
         domain = analysis["domain"]
 
-        # Get questions for domain (or general fallback)
-        questions = self.QUESTIONS.get(domain, self.QUESTIONS["general"])
-
-        # Limit to 5 questions
-        return questions[:5]
+        # Get questions for domain (or general fallback); shared, not copied
+        return self.QUESTIONS.get(domain, self.QUESTIONS["general"])
 
     def should_ask_followup(self, question: str, answer: str) -> bool:
         """
@@ -162,19 +297,9 @@ class InterviewGenerator:
         }
 
         for pair in qa_pairs:
-            q = pair["question"].lower()
-            a = pair["answer"]
-
-            if "data fields" in q or "fields" in q:
-                requirements["data_fields"] = [f.strip() for f in a.split(",")]
-            elif "websites" in q or "sources" in q:
-                requirements["sources"] = [s.strip() for s in a.split(",")]
-            elif "format" in q:
-                requirements["output_format"] = a
-            elif "often" in q or "frequency" in q:
-                requirements["frequency"] = a
-            elif "constraint" in q:
-                requirements["constraints"].append(a)
+            m = _QUESTION_RE.match(pair["question"])
+            if m:
+                _REQUIREMENT_HANDLERS[m.lastgroup](requirements, pair["answer"])
 
         return {
             "original_idea": qa_pairs[0].get("context", "") if qa_pairs else "",
@@ -8,7 +8,29 @@ MVP: Template-based with requirements filled in.
 Future: AI-generated detailed plans.
 """
 
-from typing import Dict
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, List, Tuple
+
+_FORMATTER = Formatter()
+
+
+def _compile_template(template: str) -> List[Tuple]:
+    """Parse a str.format template once into (literal, field, spec, conversion) parts."""
+    return list(_FORMATTER.parse(template))
+
+
+def _render_template(parts: List[Tuple], context: Dict) -> str:
+    """Render pre-parsed template parts; equivalent to template.format(**context)."""
+    out = []
+    for literal, field, spec, conversion in parts:
+        out.append(literal)
+        if field is not None:
+            value = context[field]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            out.append(format(value, spec))
+    return "".join(out)
 
 
 class PlanGenerator:
@@ -129,12 +151,26 @@ Build a tool that solves: {description}
 """
     }
 
+    # Templates parsed once at class load; create_plan only substitutes values
+    COMPILED_TEMPLATES = {
+        domain: _compile_template(template)
+        for domain, template in TEMPLATES.items()
+    }
+
+    # Build iterations by complexity (read-only)
+    ITERATIONS_BY_COMPLEXITY = MappingProxyType(
+        {"simple": 5, "medium": 7, "complex": 10}
+    )
+
+    # Assume ~$0.50 per iteration average
+    COST_PER_ITERATION = 0.50
+
     def __init__(self):
         self.max_revisions = 3
 
     def _estimate_iterations(self, complexity: str) -> int:
         """Estimate build iterations based on complexity."""
-        return {"simple": 5, "medium": 7, "complex": 10}.get(complexity, 7)
+        return self.ITERATIONS_BY_COMPLEXITY.get(complexity, 7)
 
     def _assess_risk(self, requirements: Dict) -> str:
         """Assess risk level."""
@@ -146,8 +182,7 @@ Build a tool that solves: {description}
 
     def _estimate_cost(self, iterations: int) -> float:
         """Estimate total cost based on iterations."""
-        # Assume ~$0.50 per iteration average
-        return iterations * 0.50
+        return iterations * self.COST_PER_ITERATION
 
     def create_plan(self, requirements: Dict, project_name: str = "Untitled") -> str:
         """
@@ -161,11 +196,14 @@ Build a tool that solves: {description}
             Markdown plan string
         """
         domain = requirements.get("domain", "general")
-        template = self.TEMPLATES.get(domain, self.TEMPLATES["general"])
+        template = self.COMPILED_TEMPLATES.get(
+            domain, self.COMPILED_TEMPLATES["general"]
+        )
 
         # Extract values from requirements
         reqs = requirements.get("requirements", {})
         complexity = requirements.get("complexity", "medium")
+        iterations = self._estimate_iterations(complexity)
 
         # Fill template
         context = {
@@ -174,19 +212,17 @@ Build a tool that solves: {description}
             "sources": ", ".join(reqs.get("sources", ["TBD"])),
             "output_format": reqs.get("output_format", "JSON"),
             "frequency": reqs.get("frequency", "on-demand"),
-            "constraints": "\n".join(f"- {c}" for c in reqs.get("constraints", ["None"])),
+            "constraints": "\n".join(["- " + c for c in reqs.get("constraints", ["None"])]),
             "description": requirements.get("inferred_intent", "Build a tool"),
             "trigger": reqs.get("trigger", "manual"),
             "actions": reqs.get("actions", "process data"),
-            "estimated_iterations": self._estimate_iterations(complexity),
+            "estimated_iterations": iterations,
             "complexity": complexity,
             "risk_level": self._assess_risk(requirements),
-            "estimated_cost": self._estimate_cost(
-                self._estimate_iterations(complexity)
-            )
+            "estimated_cost": self._estimate_cost(iterations)
         }
 
-        return template.format(**context)
+        return _render_template(template, context)
 
     def revise_plan(self, original_plan: str, feedback: str) -> str:
         """
@@ -10,17 +10,14 @@ Called by surplus_scanner.py for each item found by surplus_scraper.py.
 import re
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from urllib.parse import quote_plus
 
 import requests
 from bs4 import BeautifulSoup
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # eBay configuration
@@ -44,18 +41,32 @@ REQUEST_HEADERS = {
 MIN_VALID_PRICE = 5.0  # Filter out prices under $5 (likely parts/accessories)
 MAX_RESULTS = 15  # Maximum number of results to analyze
 
-# Track last request time for rate limiting
+# Price patterns: "$1,234.56" / "C $99.00", bare "50.00", and price-like span classes
+PRICE_RE = re.compile(r'\$\s*([\d,]+\.?\d*)')
+BARE_PRICE_RE = re.compile(r'([\d,]+\.\d{2})')
+PRICE_CLASS_RE = re.compile(r'price|sold', re.I)
+
+# Threads used by research_batch; requests still respect REQUEST_DELAY
+BATCH_WORKERS = 10
+
+# Reused connection pool (keep-alive) for callers that don't pass a session
+_SESSION = requests.Session()
+
+# Track last request time for rate limiting (shared across threads)
 _last_request_time = 0
+_rate_lock = threading.Lock()
 
 
 def _rate_limit():
-    """Enforce rate limiting between requests."""
+    """Enforce rate limiting between requests, safe to call from many threads."""
     global _last_request_time
-    now = time.time()
-    elapsed = now - _last_request_time
-    if elapsed < REQUEST_DELAY:
-        time.sleep(REQUEST_DELAY - elapsed)
-    _last_request_time = time.time()
+    with _rate_lock:
+        now = time.time()
+        wait = _last_request_time + REQUEST_DELAY - now
+        # Reserve the next request slot before sleeping outside the lock
+        _last_request_time = now + max(wait, 0)
+    if wait > 0:
+        time.sleep(wait)
 
 
 def _clean_price(price_text: str) -> Optional[float]:
@@ -67,10 +78,10 @@ def _clean_price(price_text: str) -> Optional[float]:
         return None
 
     # Find price pattern - handles currency symbols and commas
-    match = re.search(r'\$\s*([\d,]+\.?\d*)', price_text)
+    match = PRICE_RE.search(price_text)
     if not match:
         # Try without $ symbol (some listings show just numbers)
-        match = re.search(r'([\d,]+\.\d{2})', price_text)
+        match = BARE_PRICE_RE.search(price_text)
 
     if match:
         try:
@@ -83,7 +94,7 @@ def _clean_price(price_text: str) -> Optional[float]:
     return None
 
 
-def _fetch_search_results(search_term: str) -> Optional[BeautifulSoup]:
+def _fetch_search_results(search_term: str, session: Optional[requests.Session] = None) -> Optional[BeautifulSoup]:
     """Fetch eBay search results page."""
     _rate_limit()
 
@@ -92,7 +103,7 @@ def _fetch_search_results(search_term: str) -> Optional[BeautifulSoup]:
 
     try:
         logger.info(f"Searching eBay for: {search_term}")
-        response = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
+        response = (session or _SESSION).get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return BeautifulSoup(response.text, 'html.parser'), url
     except requests.Timeout:
@@ -134,7 +145,7 @@ def _extract_prices(soup: BeautifulSoup) -> list[float]:
     # Also try alternate layout (sometimes eBay shows different formats)
     if not prices:
         # Try finding price spans directly
-        price_spans = soup.find_all('span', class_=re.compile(r'price|sold', re.I))
+        price_spans = soup.find_all('span', class_=PRICE_CLASS_RE)
         for span in price_spans[:MAX_RESULTS]:
             price = _clean_price(span.get_text())
             if price and price >= MIN_VALID_PRICE:
@@ -153,12 +164,13 @@ def _calculate_confidence(sold_count: int) -> str:
         return 'low'
 
 
-def research(search_term: str) -> Optional[dict]:
+def research(search_term: str, session: Optional[requests.Session] = None) -> Optional[dict]:
     """
     Research eBay sold prices for a given search term.
 
     Args:
         search_term: Item description to search for (e.g., "Dell 3400MP Projector")
+        session: Optional shared requests.Session to send the request with
 
     Returns:
         Dictionary with price research data, or None if no results found.
@@ -175,7 +187,7 @@ def research(search_term: str) -> Optional[dict]:
     search_term = search_term.strip()
 
     # Fetch search results
-    result = _fetch_search_results(search_term)
+    result = _fetch_search_results(search_term, session)
     if result[0] is None:
         return None
 
@@ -223,14 +235,22 @@ def research_batch(search_terms: list[str]) -> list[Optional[dict]]:
     Returns:
         List of research results (None for items with no results)
     """
-    results = []
-    for term in search_terms:
-        result = research(term)
-        results.append(result)
-    return results
+    if not search_terms:
+        return []
+
+    # Network-bound: threads overlap the waits while _rate_limit keeps
+    # request starts REQUEST_DELAY apart. map() preserves input order.
+    with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(search_terms))) as executor:
+        return list(executor.map(research, search_terms))
 
 
 if __name__ == '__main__':
+    # Configure logging only when run as a script, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
     # Test run
     print("=" * 60)
     print("eBay Sold Price Researcher - Test Run")
@@ -14,8 +14,8 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.token_tracker import TokenGuardian, BudgetExceeded
-from src.core.interview import InterviewGenerator
-from src.core.planner import PlanGenerator
+from src.core.interview import InterviewGenerator, _KEYWORD_RE
+from src.core.planner import PlanGenerator, _compile_template, _render_template
 from src.core.builder import IterationBuilder, IterationResult
 from src.core.ralph_lite import BuildPhase, BuildState, RalphLiteOrchestrator
 
@@ -84,6 +84,24 @@ class TestInterviewGenerator:
         result = gen.analyze_idea("Build something cool")
         assert result["domain"] == "general"
 
+    def test_analyze_idea_priority_and_keywords(self):
+        gen = InterviewGenerator()
+        result = gen.analyze_idea("Automate a scraper bot that calls an API")
+        assert result["domain"] == "web_scraping"
+        assert result["keywords"] == ["scrape", "automate", "api", "bot"]
+
+    def test_analyze_idea_cached_result_not_shared(self):
+        gen = InterviewGenerator()
+        first = gen.analyze_idea("Automate the api bot")
+        first["keywords"].append("mutated")
+        second = gen.analyze_idea("Automate the api bot")
+        assert second["keywords"] == ["automate", "api", "bot"]
+
+    def test_keyword_regex_fallback(self):
+        text = "robots crawl the rapid api dashboard"
+        found = {m.group(1) for m in _KEYWORD_RE.finditer(text)}
+        assert found == {"bot", "crawl", "api", "dashboard"}
+
     def test_generate_questions(self):
         gen = InterviewGenerator()
         questions = gen.generate_questions("scrape data from sites")
@@ -99,6 +117,22 @@ class TestInterviewGenerator:
         result = gen.summarize_requirements(qa_pairs)
         assert "requirements" in result
 
+    def test_summarize_requirements_classification(self):
+        gen = InterviewGenerator()
+        qa_pairs = [
+            {"question": "Which FIELDS from which sources?", "answer": " a ,, b c ,"},
+            {"question": "What format for output?", "answer": "CSV"},
+            {"question": "How often should this run?", "answer": "daily"},
+            {"question": "Any constraint?", "answer": "no login"},
+            {"question": "Anything else?", "answer": "ignored"}
+        ]
+        reqs = gen.summarize_requirements(qa_pairs)["requirements"]
+        assert reqs["data_fields"] == ["a", "b c"]
+        assert reqs["sources"] == []
+        assert reqs["output_format"] == "CSV"
+        assert reqs["frequency"] == "daily"
+        assert reqs["constraints"] == ["no login"]
+
 
 class TestPlanGenerator:
     """Tests for planning phase."""
@@ -128,6 +162,12 @@ class TestPlanGenerator:
         plan = pg.create_plan(requirements, "Generic Tool")
         assert "Generic Tool" in plan
 
+    def test_compiled_template_matches_format(self):
+        template = "# {name!r}\nCost: ${cost:.2f} ({count}) {{literal}}"
+        context = {"name": "Tool", "cost": 3.5, "count": 7}
+        rendered = _render_template(_compile_template(template), context)
+        assert rendered == template.format(**context)
+
     def test_estimate_iterations(self):
         pg = PlanGenerator()
         assert pg._estimate_iterations("simple") == 5
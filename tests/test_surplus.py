@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the surplus scanning pipeline (ROI, scraping, ranking).
+"""
+
+import importlib.util
+
+import pytest
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.surplus import roi_calculator as src_roi_calculator
+
+# The cron scanner ships its own copy of the surplus modules
+SRC_DIR = Path(__file__).parent.parent / 'src' / 'surplus'
+SCANNER_DIR = Path(__file__).parent.parent / '99-System' / 'surplus-scanner'
+SCANNER_MODULES = ('__init__', 'ebay_researcher', 'roi_calculator', 'surplus_scanner', 'surplus_scraper')
+
+
+def _load_scanner_module(name):
+    """Import a module from the surplus-scanner copy under a private name."""
+    spec = importlib.util.spec_from_file_location(f'_scanner_copy_{name}', SCANNER_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("name", SCANNER_MODULES)
+def test_scanner_copy_matches_src(name):
+    """The surplus-scanner copy stays identical to src/surplus."""
+    assert (SCANNER_DIR / f'{name}.py').read_text() == (SRC_DIR / f'{name}.py').read_text()
+
+
+class TestROICalculator:
+    """Tests for ROI math and its cent rounding."""
+
+    @pytest.fixture(params=['src', 'surplus-scanner'])
+    def roi_calculator(self, request):
+        if request.param == 'src':
+            return src_roi_calculator
+        return _load_scanner_module('roi_calculator')
+
+    @pytest.mark.parametrize("bid, average, expected", [
+        (72.38, 1494, {'ebay_fees': 145.66, 'net_proceeds': 959.84, 'max_bid_100_roi': 479.92}),
+        (10.00, 4876, {'ebay_fees': 475.41, 'net_proceeds': 3166.59, 'max_bid_100_roi': 1583.30}),
+    ])
+    def test_fee_chain_rounding(self, roi_calculator, bid, average, expected):
+        """Fees come off the expected sale before net proceeds are derived."""
+        for result in (
+            roi_calculator.calculate(bid, {'average_price': average}),
+            roi_calculator.calculate_batch([(bid, {'average_price': average})])[0],
+        ):
+            for field, value in expected.items():
+                assert result[field] == value
+
+    def test_batch_array_matches_calculate(self, roi_calculator):
+        """Each valid record matches calculate(); invalid rows are NaN with no recommendation."""
+        np = pytest.importorskip('numpy')
+        items = [
+            (72.38, {'average_price': 1494}),
+            (0, {'average_price': 100}),
+            (250.0, {'average_price': 600}),
+            (10.0, None),
+            (15.5, {'average_price': None}),
+            (40.0, {'average_price': -5}),
+            (10.00, {'average_price': 4876}),
+        ]
+        arr = roi_calculator.calculate_batch_array(items)
+        assert len(arr) == len(items)
+
+        for record, (bid, data) in zip(arr, items):
+            expected = roi_calculator.calculate(bid, data)
+            if expected is None:
+                assert all(np.isnan(record[name]) for name in roi_calculator.ROI_FIELDS)
+                assert record['recommendation'] == ''
+                continue
+            for name in roi_calculator.ROI_FIELDS:
+                assert float(record[name]) == pytest.approx(expected[name], abs=0.01)
+            assert record['recommendation'] == expected['recommendation']
+
+        # NaN rows drop out of vector filters
+        strong = arr[arr['roi_percent'] >= roi_calculator.MIN_ROI_PERCENT]
+        assert list(strong['recommendation']) == ['STRONG BID', 'STRONG BID']
+
+
+GRIDVIEW_HTML = b"""<html><body>
+<table class="layout"><tr><td>Header chrome</td></tr></table>
+<table id="ctl00_Main_GridView1" class="grid">
+  <tr><th>Item</th><th>Bid</th><th>Location</th></tr>
+  <tr>
+    <td><a id="ctl00_Main_GridView1_ctl02_hlTitle" href="ItemDetail.aspx?AuctionID=1001">Dell OptiPlex 7080</a></td>
+    <td><span id="ctl00_Main_GridView1_ctl02_lblHighBidAmt">$1,125.50</span>
+        <span id="ctl00_Main_GridView1_ctl02_lblBidCount">7 bids</span></td>
+    <td><span id="ctl00_Main_GridView1_ctl02_lblLocation">Surplus Sales Calgary</span>
+        <span id="ctl00_Main_GridView1_ctl02_lblCondition">Good</span>
+        <div id="ctl00_Main_GridView1_ctl02_pnlCountdown" closingdate="2099-03-04T18:00:00"></div></td>
+  </tr>
+  <tr>
+    <td><a href="ItemDetail.aspx?AuctionID=1002">1002</a>
+        <a href="ItemDetail.aspx?AuctionID=1002">HP LaserJet M404</a></td>
+    <td><span id="ctl00_Main_GridView1_ctl03_lblStartBid">CAD 40.00</span></td>
+    <td>Surplus Sales Calgary
+        <span id="ctl00_Main_GridView1_ctl03_lblClose">03/04/2099 06:00:00 PM</span></td>
+  </tr>
+  <tr>
+    <td><a id="ctl00_Main_GridView1_ctl04_hlTitle" href="ItemDetail.aspx?AuctionID=1003">Edmonton Monitor</a></td>
+    <td><span id="ctl00_Main_GridView1_ctl04_lblHighBidAmt">$20.00</span></td>
+    <td><span id="ctl00_Main_GridView1_ctl04_lblLocation">Surplus Sales Edmonton</span></td>
+  </tr>
+  <tr>
+    <td><a id="ctl00_Main_GridView1_ctl05_hlTitle" href="ItemDetail.aspx?AuctionID=1004">Ended Projector</a></td>
+    <td><span id="ctl00_Main_GridView1_ctl05_lblLocation">Surplus Sales Calgary</span>
+        <span id="ctl00_Main_GridView1_ctl05_lblClose">2000-01-01T00:00:00</span></td>
+  </tr>
+</table>
+</body></html>"""
+
+
+class TestSurplusScraper:
+    """Tests for category page parsing and its field helpers."""
+
+    @pytest.fixture
+    def scraper(self):
+        from src.surplus.surplus_scraper import SurplusScraper
+        return SurplusScraper()
+
+    def test_parse_category_backends_agree(self, scraper, monkeypatch):
+        """selectolax and the bs4 + SoupStrainer fallback parse a GridView identically."""
+        from src.surplus import surplus_scraper
+        if surplus_scraper.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+
+        fast = scraper._parse_category(GRIDVIEW_HTML, '49')
+        monkeypatch.setattr(surplus_scraper, 'LexborHTMLParser', None)
+        fallback = scraper._parse_category(GRIDVIEW_HTML, '49')
+
+        assert fast == fallback
+        assert [item['item_id'] for item in fast] == ['1001', '1002']
+        first, second = fast
+        assert first['title'] == 'Dell OptiPlex 7080'
+        assert first['current_bid'] == 1125.50
+        assert first['bid_count'] == 7
+        assert first['condition'] == 'Good'
+        assert first['end_date'] == '2099-03-04 18:00:00'
+        assert first['url'] == 'https://www.surplus.gov.ab.ca/OA/ItemDetail.aspx?AuctionID=1001'
+        # No title/location spans: link text and cell text fallbacks
+        assert second['title'] == 'HP LaserJet M404'
+        assert second['current_bid'] == 40.0
+        assert second['condition'] == 'As-Is'
+        assert second['end_date'] == '2099-03-04 18:00:00'
+
+    @pytest.mark.parametrize("elem_id, field", [
+        ('ctl00_Main_GridView1_ctl02_hlTitle', 'title'),
+        ('ctl00_Main_GridView1_ctl02_lblHighBidAmt', 'high_bid'),
+        ('ctl00_Main_GridView1_ctl02_HighBid', 'high_bid'),
+        ('ctl00_Main_GridView1_ctl03_lblStartBid', 'start_bid'),
+        ('ctl00_Main_GridView1_ctl03_StartingBid', 'start_bid'),
+        ('ctl00_Main_GridView1_ctl02_lblBidCount', 'bid_count'),
+        ('ctl00_Main_GridView1_ctl02_NumBids', 'bid_count'),
+        ('ctl00_Main_GridView1_ctl02_pnlCountdown', 'countdown'),
+        ('ctl00_Main_GridView1_ctl03_lblClose', 'close'),
+        ('ctl00_Main_GridView1_ctl03_ClosingDate', 'close'),
+        ('ctl00_Main_GridView1_ctl02_lblLocation', 'location'),
+        ('ctl00_Main_GridView1_ctl02_lblCondition', 'condition'),
+        ('ctl00_Main_GridView1_ctl02_lblhighbidamt', 'high_bid'),
+        ('ctl00_Main_GridView1_ctl02_lblNotes', None),
+    ])
+    def test_field_id_extraction(self, elem_id, field):
+        """Element ids map to the row field they hold."""
+        from src.surplus.surplus_scraper import FIELD_ID_RE
+        match = FIELD_ID_RE.search(elem_id)
+        assert (match.lastgroup if match else None) == field
+
+    @pytest.mark.parametrize("date_str, expected", [
+        ('2026-03-04T18:00:00', ('2026-03-04 18:00:00', True)),
+        ('2026-03-04 09:30:00', ('2026-03-04 09:30:00', True)),
+        ('03/04/2026 06:00:00 PM', ('2026-03-04 18:00:00', True)),
+        ('03/04/2026 18:00:00', ('2026-03-04 18:00:00', True)),
+        ('03/04/2026', ('2026-03-04 00:00:00', True)),
+        ('2026-02-28T23:59:59', ('2026-02-28 23:59:59', False)),
+        ('02/28/2026 11:59:59 PM', ('2026-02-28 23:59:59', False)),
+        # tz-aware ISO can't be compared with local time; legacy formats fail too
+        ('2026-03-04T18:00:00+00:00', ('2026-03-04T18:00:00+00:00', True)),
+        ('  Closing soon  ', ('Closing soon', True)),
+        ('', ('', True)),
+    ])
+    def test_parse_end_date(self, scraper, date_str, expected):
+        """ISO and legacy end dates normalize and compare against now."""
+        from datetime import datetime
+        now = datetime(2026, 3, 1, 12, 0, 0)
+        assert scraper._parse_end_date(date_str, now=now) == expected
+
+
+class TestReportRanking:
+    """Tests for ordering report rows by ROI."""
+
+    def test_argsort_matches_sorted(self, monkeypatch):
+        """The NumPy ranking matches sorted(reverse=True), ties included."""
+        import random
+        from src.surplus import surplus_scanner
+        if surplus_scanner.np is None:
+            pytest.skip("numpy not installed")
+
+        rng = random.Random(7)
+        items = [
+            {'item_id': str(i), 'roi': {'roi_percent': rng.choice([-12.5, 0, 35.0, 99.99, 100, 250.25])}}
+            for i in range(200)
+        ]
+        items += [{'item_id': 'no-roi'}, {'item_id': 'no-percent', 'roi': {}}]
+        rng.shuffle(items)
+        expected = sorted(
+            items, key=lambda x: x.get('roi', {}).get('roi_percent', 0), reverse=True
+        )
+
+        assert surplus_scanner._by_roi_desc(items) == expected
+        monkeypatch.setattr(surplus_scanner, 'np', None)
+        assert surplus_scanner._by_roi_desc(items) == expected
+
+
+class TestSaveReport:
+    """Tests for writing scan reports to the vault."""
+
+    def test_failed_write_keeps_previous_report(self, tmp_path, monkeypatch):
+        """A report that fails partway leaves the earlier report untouched."""
+        from datetime import datetime
+        from src.surplus import surplus_scanner
+        monkeypatch.setattr(surplus_scanner, 'VAULT_PATH', tmp_path)
+        scan_time = datetime(2026, 1, 2)
+
+        path = surplus_scanner.save_report(iter(['# Report\n', 'row\n']), scan_time)
+        assert path.read_text(encoding='utf-8') == '# Report\nrow\n'
+
+        def failing_report():
+            yield '# Partial\n'
+            raise RuntimeError('scan aborted')
+
+        with pytest.raises(RuntimeError):
+            surplus_scanner.save_report(failing_report(), scan_time)
+        assert path.read_text(encoding='utf-8') == '# Report\nrow\n'
+        assert list(tmp_path.iterdir()) == [path]